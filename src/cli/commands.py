@@ -175,6 +175,12 @@ def import_urls() -> None:
     default=False,
     help="Include companies manually set to likely_closed (excluded by default)",
 )
+@click.option(
+    "--max-workers",
+    default=1,
+    type=int,
+    help="Concurrent scrapes without the batch API (default 1; keep within Firecrawl plan limits)",
+)
 def capture_snapshots(
     use_batch_api: bool,
     batch_size: int,
@@ -182,6 +188,7 @@ def capture_snapshots(
     company_id: int | None,
     skip_if_snapshot_since: str | None,
     include_manually_closed: bool,
+    max_workers: int,
 ) -> None:
     """Capture website snapshots for all companies."""
     config = _get_config()
@@ -251,8 +258,10 @@ def capture_snapshots(
             company_repo,
             logo_processor=logo_processor,
         )  # type: ignore[assignment]
-        click.echo("[INFO] Capturing snapshots sequentially...")
-        result = manager.capture_all_snapshots(exclude_company_ids=exclude_ids)
+        click.echo(f"[INFO] Capturing snapshots individually ({max_workers} workers)...")
+        result = manager.capture_all_snapshots(
+            exclude_company_ids=exclude_ids, max_workers=max_workers
+        )
 
     _print_summary("Snapshot capture complete", result)
 
@@ -1154,13 +1163,14 @@ def _filter_companies_for_logo_refresh(
         return companies
 
     cutoff = (datetime.now(tz=UTC) - timedelta(days=staleness_days)).isoformat()
+    latest = logo_repo.get_latest_logo_extraction_times()
     result: list[dict[str, Any]] = []
     for company in companies:
-        logo = logo_repo.get_company_logo(company["id"])
-        if logo is None:
+        extracted_at = latest.get(company["id"])
+        if extracted_at is None:
             # No logo at all
             result.append(company)
-        elif logo.get("extracted_at", "") < cutoff:
+        elif (extracted_at or "") < cutoff:
             # Logo is stale
             result.append(company)
     return result
@@ -1608,7 +1618,13 @@ def check_leadership_changes(
 @click.command()
 @click.option("--limit", default=None, type=int, help="Process first N companies")
 @click.option("--dry-run", is_flag=True, help="Preview without updating")
-def analyze_baseline(limit: int | None, dry_run: bool) -> None:
+@click.option(
+    "--max-workers",
+    default=1,
+    type=int,
+    help="Concurrent LLM classifications (only used when LLM validation is enabled)",
+)
+def analyze_baseline(limit: int | None, dry_run: bool, max_workers: int) -> None:
     """Run baseline signal analysis on company snapshots.
 
     Computes one-time baseline signals for companies that haven't been analyzed yet.
@@ -1641,7 +1657,7 @@ def analyze_baseline(limit: int | None, dry_run: bool) -> None:
 
     mode = "DRY RUN" if dry_run else "analyzing"
     click.echo(f"[INFO] {mode} baseline signals...")
-    result = analyzer.backfill_baselines(limit=limit, dry_run=dry_run)
+    result = analyzer.backfill_baselines(limit=limit, dry_run=dry_run, max_workers=max_workers)
     _print_summary("Baseline analysis complete", result)
     db.close()
 
@@ -6,8 +6,23 @@ branding format, applying third-party URL filtering. No I/O.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
+
+@dataclass(frozen=True, slots=True)
+class Branding:
+    """The logo-related subset of a Firecrawl BrandingProfile.
+
+    The SDK profile also carries fonts, colors, typography and component
+    styles, none of which the pipeline reads; keeping only these two fields
+    avoids holding the full profile for every document in a batch.
+    """
+
+    logo: str | None = None
+    images: dict[str, str | None] | None = None
+
+
 # Third-party URL patterns to reject. Kept in sync with logo_service.py.
 _SKIP_URL_PATTERNS: list[str] = [
     # Y Combinator
@@ -74,6 +89,24 @@ def extract_branding_logo_url(branding: Any) -> str | None:
     return None
 
 
+def to_branding(profile: Any) -> Branding | None:
+    """Reduce a Firecrawl BrandingProfile (or equivalent dict) to Branding.
+
+    Returns None when the profile is missing or carries no logo data.
+    """
+    if profile is None:
+        return None
+    logo = _try_string_attr(profile, "logo")
+    images = getattr(profile, "images", None)
+    if images is None and isinstance(profile, dict):
+        images = profile.get("images")
+    if not isinstance(images, dict) or not images:
+        images = None
+    if logo is None and images is None:
+        return None
+    return Branding(logo=logo, images=images)
+
+
 def _try_string_attr(obj: Any, attr: str) -> str | None:
     """Try to get a non-empty string attribute from an object or dict."""
     value = getattr(obj, attr, None)
@@ -29,7 +29,7 @@ def prepare_snapshot_data(
     # Compute checksum from markdown content
     content_checksum = None
     if markdown:
-        content_checksum = hashlib.md5(markdown.encode("utf-8")).hexdigest()
+        content_checksum = hashlib.md5(markdown.encode("utf-8"), usedforsecurity=False).hexdigest()
 
     # Parse HTTP Last-Modified if available
     metadata = scrape_result.get("metadata", {}) or {}
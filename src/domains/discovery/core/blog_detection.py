@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from enum import StrEnum
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit
 
 
 class BlogType(StrEnum):
@@ -30,30 +30,30 @@ BLOG_PLATFORM_PATTERNS: dict[BlogType, re.Pattern[str]] = {
     BlogType.WORDPRESS: re.compile(r"\.wordpress\.com", re.IGNORECASE),
 }
 
+_BLOG_SUBDOMAIN_PREFIXES = tuple(BLOG_SUBDOMAIN_PATTERNS)
+_BLOG_PATH_PREFIXES = tuple(BLOG_PATH_PATTERNS)
+
 
 def detect_blog_url(url: str) -> tuple[bool, BlogType | None]:
     """Detect if a URL is a blog and classify its type.
 
     Returns (is_blog, blog_type).
     """
-    parsed = urlparse(url)
-    netloc = parsed.netloc.lower()
-    path = parsed.path.lower()
-
     # Check platform-specific patterns first
     for blog_type, pattern in BLOG_PLATFORM_PATTERNS.items():
         if pattern.search(url):
             return True, blog_type
 
+    # Only prefix checks remain, so split without urlparse's params handling
+    parsed = urlsplit(url)
+
     # Check subdomain patterns
-    for subdomain in BLOG_SUBDOMAIN_PATTERNS:
-        if netloc.startswith(subdomain):
-            return True, BlogType.COMPANY_BLOG
+    if parsed.netloc.lower().startswith(_BLOG_SUBDOMAIN_PREFIXES):
+        return True, BlogType.COMPANY_BLOG
 
     # Check path patterns
-    for blog_path in BLOG_PATH_PATTERNS:
-        if path.startswith(blog_path):
-            return True, BlogType.COMPANY_BLOG
+    if parsed.path.lower().startswith(_BLOG_PATH_PREFIXES):
+        return True, BlogType.COMPANY_BLOG
 
     return False, None
 
@@ -6,7 +6,13 @@ import json
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from lxml import etree  # type: ignore[import-untyped]
+
+# Markdown links: [text](url) or [text](url "title")
+_MD_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+# Optional markdown title attribute after the URL: (url "title") or (url 'title')
+_MD_LINK_TITLE_PATTERN = re.compile(r"""\s+["']""")
+_BARE_URL_PATTERN = re.compile(r"https?://[^\s<>\"\'\)]+")
 
 
 def extract_links_from_markdown(markdown: str) -> list[str]:
@@ -16,55 +22,113 @@ def extract_links_from_markdown(markdown: str) -> list[str]:
     """
     urls: list[str] = []
 
-    # Match markdown links: [text](url) or [text](url "title")
-    md_link_pattern = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
-    for match in md_link_pattern.finditer(markdown):
+    for match in _MD_LINK_PATTERN.finditer(markdown):
         url = match.group(2).strip()
-        # Strip optional markdown title attribute: (url "title") or (url 'title')
-        url = re.split(r"""\s+["']""", url, maxsplit=1)[0].strip()
+        url = _MD_LINK_TITLE_PATTERN.split(url, maxsplit=1)[0].strip()
         if url.startswith(("http://", "https://")):
             urls.append(url)
 
-    # Match bare URLs
-    bare_url_pattern = re.compile(r"https?://[^\s<>\"\'\)]+")
-    for match in bare_url_pattern.finditer(markdown):
+    # Bare URLs, skipping any already collected
+    seen = set(urls)
+    for match in _BARE_URL_PATTERN.finditer(markdown):
         url = match.group(0)
-        if url not in urls:
+        if url not in seen:
+            seen.add(url)
             urls.append(url)
 
     return urls
 
 
-def extract_links_from_html(html: str, base_url: str | None = None) -> list[str]:
-    """Extract URLs from HTML <a> tags.
+_SOCIAL_KEYWORDS = (
+    "linkedin",
+    "twitter",
+    "facebook",
+    "instagram",
+    "youtube",
+    "github",
+    "tiktok",
+    "medium",
+    "mastodon",
+    "threads",
+    "pinterest",
+    "bluesky",
+    "social",
+)
 
-    Resolves relative URLs using base_url if provided.
-    """
-    soup = BeautifulSoup(html, "html.parser")
-    urls: list[str] = []
 
-    for tag in soup.find_all("a", href=True):
-        href = tag["href"]
-        if isinstance(href, list):
-            href = href[0]
-        href = href.strip()
+class _LinkCollector:
+    """lxml parser target that records link-bearing tags in one streaming pass.
 
+    No document tree is built; only the attributes and script bodies the
+    extraction strategies need are kept, in document order.
+    """
+
+    def __init__(self) -> None:
+        self.anchor_hrefs: list[str] = []
+        self.ld_json_blocks: list[str] = []
+        self.twitter_meta: list[str] = []
+        self.og_meta: list[str] = []
+        self.aria_labelled: list[tuple[str, str]] = []
+        self.titled: list[tuple[str, str]] = []
+        self._script_text: list[str] | None = None
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag in ("a", "link"):
+            href = attrib.get("href")
+            if tag == "a" and href is not None:
+                self.anchor_hrefs.append(href)
+            if "aria-label" in attrib:
+                self.aria_labelled.append((attrib["aria-label"], href or ""))
+            if "title" in attrib:
+                self.titled.append((attrib["title"], href or ""))
+        elif tag == "meta":
+            content = attrib.get("content", "")
+            if "twitter:" in attrib.get("name", "").lower():
+                self.twitter_meta.append(content)
+            if "og:" in attrib.get("property", "").lower():
+                self.og_meta.append(content)
+        elif tag == "script" and attrib.get("type") == "application/ld+json":
+            self._script_text = []
+
+    def data(self, text: str) -> None:
+        if self._script_text is not None:
+            self._script_text.append(text)
+
+    def end(self, tag: str) -> None:
+        if tag == "script" and self._script_text is not None:
+            self.ld_json_blocks.append("".join(self._script_text))
+            self._script_text = None
+
+    def close(self) -> _LinkCollector:
+        return self
+
+
+def _collect_links(html: str) -> _LinkCollector:
+    """Run the streaming lxml HTML parser over html and return the collected links."""
+    parser = etree.HTMLParser(target=_LinkCollector())
+    parser.feed(html)
+    collector: _LinkCollector = parser.close()
+    return collector
+
+
+def _anchor_links(page: _LinkCollector, base_url: str | None) -> list[str]:
+    """Resolve collected <a href> values to absolute http(s) URLs."""
+    urls: list[str] = []
+    for raw_href in page.anchor_hrefs:
+        href = raw_href.strip()
         if href.startswith(("http://", "https://")):
             urls.append(href)
         elif base_url and href.startswith("/"):
             urls.append(urljoin(base_url, href))
-
     return urls
 
 
-def extract_schema_org_links(html: str) -> list[str]:
-    """Extract social media links from Schema.org JSON-LD sameAs property."""
-    soup = BeautifulSoup(html, "html.parser")
+def _schema_org_links(page: _LinkCollector) -> list[str]:
+    """Read sameAs URLs from collected JSON-LD blocks."""
     urls: list[str] = []
-
-    for script_tag in soup.find_all("script", type="application/ld+json"):
+    for block in page.ld_json_blocks:
         try:
-            data = json.loads(script_tag.string or "")
+            data = json.loads(block)
             if isinstance(data, dict):
                 same_as = data.get("sameAs", [])
                 if isinstance(same_as, str):
@@ -85,68 +149,61 @@ def extract_schema_org_links(html: str) -> list[str]:
                                     urls.append(url)
         except (json.JSONDecodeError, TypeError):
             continue
-
     return urls
 
 
-def extract_meta_tag_links(html: str) -> list[str]:
-    """Extract social media links from meta tags (twitter:site, og:url, etc.)."""
-    soup = BeautifulSoup(html, "html.parser")
+def _meta_tag_links(page: _LinkCollector) -> list[str]:
+    """Turn collected twitter:* and og:* meta contents into URLs."""
     urls: list[str] = []
 
     # Twitter card meta tags
-    for tag in soup.find_all("meta", attrs={"name": re.compile(r"twitter:", re.IGNORECASE)}):
-        content = tag.get("content", "")
-        if isinstance(content, str) and content.startswith(("http://", "https://")):
+    for content in page.twitter_meta:
+        if content.startswith(("http://", "https://")):
             urls.append(content)
-        elif isinstance(content, str) and content.startswith("@"):
+        elif content.startswith("@"):
             urls.append(f"https://twitter.com/{content.lstrip('@')}")
 
     # Open Graph meta tags
-    for tag in soup.find_all("meta", attrs={"property": re.compile(r"og:", re.IGNORECASE)}):
-        content = tag.get("content", "")
-        if isinstance(content, str) and content.startswith(("http://", "https://")):
+    for content in page.og_meta:
+        if content.startswith(("http://", "https://")):
             urls.append(content)
 
     return urls
 
 
-def extract_aria_label_links(html: str) -> list[str]:
-    """Extract links from elements with aria-labels or title attributes related to social media."""
-    soup = BeautifulSoup(html, "html.parser")
+def _aria_label_links(page: _LinkCollector) -> list[str]:
+    """Keep hrefs whose aria-label or title mentions a social platform."""
     urls: list[str] = []
+    for label, href in (*page.aria_labelled, *page.titled):
+        lowered = label.lower()
+        if any(kw in lowered for kw in _SOCIAL_KEYWORDS) and href.startswith(
+            ("http://", "https://")
+        ):
+            urls.append(href)
+    return urls
 
-    social_keywords = [
-        "linkedin",
-        "twitter",
-        "facebook",
-        "instagram",
-        "youtube",
-        "github",
-        "tiktok",
-        "medium",
-        "mastodon",
-        "threads",
-        "pinterest",
-        "bluesky",
-        "social",
-    ]
-
-    for tag in soup.find_all(["a", "link"], attrs={"aria-label": True}):
-        label = tag.get("aria-label", "").lower()
-        if any(kw in label for kw in social_keywords):
-            href = tag.get("href", "")
-            if isinstance(href, str) and href.startswith(("http://", "https://")):
-                urls.append(href)
-
-    for tag in soup.find_all(["a", "link"], attrs={"title": True}):
-        title = tag.get("title", "").lower()
-        if any(kw in title for kw in social_keywords):
-            href = tag.get("href", "")
-            if isinstance(href, str) and href.startswith(("http://", "https://")):
-                urls.append(href)
 
-    return urls
+def extract_links_from_html(html: str, base_url: str | None = None) -> list[str]:
+    """Extract URLs from HTML <a> tags.
+
+    Resolves relative URLs using base_url if provided.
+    """
+    return _anchor_links(_collect_links(html), base_url)
+
+
+def extract_schema_org_links(html: str) -> list[str]:
+    """Extract social media links from Schema.org JSON-LD sameAs property."""
+    return _schema_org_links(_collect_links(html))
+
+
+def extract_meta_tag_links(html: str) -> list[str]:
+    """Extract social media links from meta tags (twitter:site, og:url, etc.)."""
+    return _meta_tag_links(_collect_links(html))
+
+
+def extract_aria_label_links(html: str) -> list[str]:
+    """Extract links from elements with aria-labels or title attributes related to social media."""
+    return _aria_label_links(_collect_links(html))
 
 
 _TWITTER_STATUS_PATTERN = re.compile(
@@ -227,11 +284,13 @@ def extract_all_social_links(
         all_urls.extend(extract_links_from_markdown(markdown))
 
     if html:
-        all_urls.extend(extract_links_from_html(html, base_url))
+        # One streaming parse feeds every HTML strategy
+        page = _collect_links(html)
+        all_urls.extend(_anchor_links(page, base_url))
 
-        schema_urls = extract_schema_org_links(html)
-        meta_urls = extract_meta_tag_links(html)
-        aria_urls = extract_aria_label_links(html)
+        schema_urls = _schema_org_links(page)
+        meta_urls = _meta_tag_links(page)
+        aria_urls = _aria_label_links(page)
 
         trusted_urls.update(schema_urls)
         trusted_urls.update(meta_urls)
@@ -241,15 +300,5 @@ def extract_all_social_links(
         all_urls.extend(meta_urls)
         all_urls.extend(aria_urls)
 
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique_urls: list[str] = []
-    for url in all_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
-
-    # Filter out Twitter/X embed noise
-    unique_urls = filter_twitter_embeds(unique_urls, trusted_urls)
-
-    return unique_urls
+    # Deduplicate while preserving order, then filter out Twitter/X embed noise
+    return filter_twitter_embeds(list(dict.fromkeys(all_urls)), trusted_urls)
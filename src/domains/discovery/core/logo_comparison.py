@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
-import imagehash
-
 
 def compute_hash_similarity(hash1: str, hash2: str) -> float:
     """Compute similarity between two perceptual hashes.
 
     Uses Hamming distance. Returns float 0.0-1.0.
     """
-    h1 = imagehash.hex_to_hash(hash1)
-    h2 = imagehash.hex_to_hash(hash2)
-    max_distance = len(h1.hash.flatten())
-    hamming_distance = h1 - h2
+    if len(hash1) != len(hash2):
+        msg = f"Perceptual hashes differ in length: {len(hash1)} vs {len(hash2)}"
+        raise TypeError(msg)
+    max_distance = len(hash1) * 4
     if max_distance == 0:
         return 1.0
+    # int.bit_count() is a single popcount over the XOR of the packed bits
+    hamming_distance = (int(hash1, 16) ^ int(hash2, 16)).bit_count()
     return 1.0 - (hamming_distance / max_distance)
 
 
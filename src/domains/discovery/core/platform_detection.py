@@ -38,12 +38,21 @@ PLATFORM_PATTERNS: list[tuple[Platform, re.Pattern[str]]] = [
     (Platform.PINTEREST, re.compile(r"pinterest\.com/", re.IGNORECASE)),
 ]
 
+# Union of every platform pattern, matched case-sensitively against the
+# lowercased URL (IGNORECASE defeats sre's literal fast paths). Most links on a
+# page match no platform and are rejected here in a single search.
+_ANY_PLATFORM_PATTERN = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for _, pattern in PLATFORM_PATTERNS)
+)
+
 
 def detect_platform(url: str) -> Platform | None:
     """Detect the social media platform from a URL.
 
     Returns the matched Platform enum or None if no platform detected.
     """
+    if not _ANY_PLATFORM_PATTERN.search(url.lower()):
+        return None
     for platform, pattern in PLATFORM_PATTERNS:
         if pattern.search(url):
             return platform
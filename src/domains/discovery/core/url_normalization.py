@@ -39,9 +39,24 @@ def normalize_social_url(url: str) -> str:
     return clean_url
 
 
+# Profile-level prefixes; anything after group 1 is a sub-page to drop
+_GITHUB_ORG_PATTERN = re.compile(r"(https?://github\.com/[^/]+)(/.*)?$", re.IGNORECASE)
+_LINKEDIN_PROFILE_PATTERN = re.compile(
+    r"(https?://(?:www\.)?linkedin\.com/(?:company|in)/[^/]+)(/.*)?$", re.IGNORECASE
+)
+_YOUTUBE_CHANNEL_PATTERNS: tuple[re.Pattern[str], ...] = (
+    # @handle format
+    re.compile(r"(https?://(?:www\.)?youtube\.com/@[^/]+)(/.*)?$", re.IGNORECASE),
+    # /channel/ID format
+    re.compile(r"(https?://(?:www\.)?youtube\.com/channel/[^/]+)(/.*)?$", re.IGNORECASE),
+    # /c/name format
+    re.compile(r"(https?://(?:www\.)?youtube\.com/c/[^/]+)(/.*)?$", re.IGNORECASE),
+)
+
+
 def _normalize_github(url: str) -> str:
     """Normalize GitHub URLs to org level (remove repo paths)."""
-    match = re.match(r"(https?://github\.com/[^/]+)(/.*)?$", url, re.IGNORECASE)
+    match = _GITHUB_ORG_PATTERN.match(url)
     if match:
         return match.group(1)
     return url
@@ -49,11 +64,7 @@ def _normalize_github(url: str) -> str:
 
 def _normalize_linkedin(url: str) -> str:
     """Normalize LinkedIn URLs (remove /about, /posts, etc.)."""
-    match = re.match(
-        r"(https?://(?:www\.)?linkedin\.com/(?:company|in)/[^/]+)(/.*)?$",
-        url,
-        re.IGNORECASE,
-    )
+    match = _LINKEDIN_PROFILE_PATTERN.match(url)
     if match:
         return match.group(1)
     return url
@@ -61,18 +72,10 @@ def _normalize_linkedin(url: str) -> str:
 
 def _normalize_youtube(url: str) -> str:
     """Normalize YouTube URLs to channel level."""
-    # Handle @handle format
-    match = re.match(r"(https?://(?:www\.)?youtube\.com/@[^/]+)(/.*)?$", url, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    # Handle /channel/ID format
-    match = re.match(r"(https?://(?:www\.)?youtube\.com/channel/[^/]+)(/.*)?$", url, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    # Handle /c/name format
-    match = re.match(r"(https?://(?:www\.)?youtube\.com/c/[^/]+)(/.*)?$", url, re.IGNORECASE)
-    if match:
-        return match.group(1)
+    for pattern in _YOUTUBE_CHANNEL_PATTERNS:
+        match = pattern.match(url)
+        if match:
+            return match.group(1)
     return url
 
 
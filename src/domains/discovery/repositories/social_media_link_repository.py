@@ -9,10 +9,15 @@ import structlog
 from src.domains.discovery.core.url_normalization import normalize_social_url
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from src.services.database import Database
 
 logger = structlog.get_logger(__name__)
 
+# Maximum bound parameters per IN (...) query, well under SQLite's limit.
+_IN_CLAUSE_CHUNK = 500
+
 
 class SocialMediaLinkRepository:
     """Repository for social media link data access."""
@@ -166,7 +171,36 @@ class SocialMediaLinkRepository:
         )
         return dict(row) if row else None
 
-    def get_company_ids_with_logos(self) -> set[int]:
-        """Get the set of company IDs that have at least one stored logo."""
-        rows = self.db.fetchall("SELECT DISTINCT company_id FROM company_logos")
-        return {row["company_id"] for row in rows}
+    def get_latest_logo_extraction_times(self) -> dict[int, str]:
+        """Map each company with a stored logo to its newest extracted_at.
+
+        Selects only the two columns, so no image data is read.
+        """
+        rows = self.db.fetchall(
+            "SELECT company_id, MAX(extracted_at) AS extracted_at"
+            " FROM company_logos GROUP BY company_id"
+        )
+        return {row["company_id"]: row["extracted_at"] for row in rows}
+
+    def get_company_ids_with_logos(self, company_ids: Iterable[int] | None = None) -> set[int]:
+        """Get the set of company IDs that have at least one stored logo.
+
+        When company_ids is given, only those companies are checked, in one
+        query per chunk of IDs rather than one query per company.
+        """
+        if company_ids is None:
+            rows = self.db.fetchall("SELECT DISTINCT company_id FROM company_logos")
+            return {row["company_id"] for row in rows}
+
+        ids = list(dict.fromkeys(company_ids))
+        found: set[int] = set()
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = tuple(ids[start : start + _IN_CLAUSE_CHUNK])
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.fetchall(
+                "SELECT DISTINCT company_id FROM company_logos"
+                f" WHERE company_id IN ({placeholders})",
+                chunk,
+            )
+            found.update(row["company_id"] for row in rows)
+        return found
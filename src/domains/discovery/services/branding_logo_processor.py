@@ -7,23 +7,35 @@ and the company has no existing logo.
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.core.branding import extract_branding_logo_url
 from src.utils.image_utils import (
     compute_perceptual_hash,
+    compute_perceptual_hashes,
     encode_image_to_base64,
     get_image_dimensions,
     image_from_bytes,
     is_valid_logo_size,
     resize_image,
+    sniff_image_format,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from PIL import Image
+
     from src.domains.discovery.repositories.social_media_link_repository import (
         SocialMediaLinkRepository,
     )
@@ -42,8 +54,50 @@ _SKIP_PERCEPTUAL_HASHES: set[str] = {
 }
 
 _REQUEST_TIMEOUT = 15
+# Dead or firewalled logo hosts should fail fast instead of holding a
+# download worker for the full read timeout.
+_CONNECT_TIMEOUT = 5
 _USER_AGENT = "Mozilla/5.0 (compatible; LogoExtractor/1.0)"
 
+# Connection pool size per scheme. Logo hosts repeat heavily (CDNs, site
+# builders), so keep-alive connections are reused across companies.
+_POOL_SIZE = 32
+
+# Concurrent downloads for process_branding_logos_bulk().
+_BULK_DOWNLOAD_WORKERS = 16
+
+# Downloads larger than this are rejected before decoding. Real logos are
+# tiny; anything this big is a banner, a video, or a hostile payload.
+_MAX_LOGO_BYTES = 5 * 1024 * 1024
+
+# Streamed bodies are read in chunks of this size so the cap above is enforced
+# while downloading, even when Content-Length is missing or wrong.
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of decoded logos remembered per processor, keyed by a digest
+# of the downloaded bytes. Many companies share favicons or hosting-provider
+# default logos, so repeats are common within a single run.
+_PROCESSED_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class _ProcessedLogo:
+    """Result of decoding, resizing and hashing one downloaded image."""
+
+    perceptual_hash: str
+    width: int
+    height: int
+    image_base64: str
+
+
+def _encode_png(image: Image.Image) -> str:
+    """Encode an image as base64 PNG for storage."""
+    try:
+        return encode_image_to_base64(image, format="PNG")
+    except Exception:
+        # Some images (CMYK, P mode) need conversion
+        return encode_image_to_base64(image.convert("RGBA"), format="PNG")
+
 
 class BrandingLogoProcessor:
     """Downloads branding logos and stores them in the company_logos table.
@@ -54,10 +108,30 @@ class BrandingLogoProcessor:
 
     def __init__(self, logo_repo: SocialMediaLinkRepository) -> None:
         self.logo_repo = logo_repo
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": _USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_SIZE,
+            pool_maxsize=_POOL_SIZE,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504),
+                # A CDN's Retry-After can be minutes long; one logo is not worth it
+                respect_retry_after_header=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._processed_cache: OrderedDict[bytes, _ProcessedLogo] = OrderedDict()
 
     def company_has_logo(self, company_id: int) -> bool:
         """Check if a company already has a stored logo."""
-        return self.logo_repo.get_company_logo(company_id) is not None
+        return company_id in self.logo_repo.get_company_ids_with_logos([company_id])
+
+    def company_ids_with_logos(self, company_ids: Iterable[int]) -> set[int]:
+        """Return the subset of company_ids that already have a stored logo."""
+        return self.logo_repo.get_company_ids_with_logos(company_ids)
 
     def process_branding_logo(
         self,
@@ -73,15 +147,58 @@ class BrandingLogoProcessor:
             logger.debug("no_branding_logo_url", company_id=company_id)
             return False
 
-        return self._download_and_store(company_id, logo_url)
+        content = self._download(company_id, logo_url)
+        if content is None:
+            return False
+        return self._store_many([(company_id, logo_url, content)]) == 1
+
+    def process_branding_logos_bulk(
+        self,
+        items: list[tuple[int, Any]],
+        max_workers: int = _BULK_DOWNLOAD_WORKERS,
+    ) -> int:
+        """Process branding logos for many companies, overlapping downloads.
+
+        Downloads run on a thread pool; decoding and database writes stay on
+        the calling thread so the SQLite connection is only touched by the
+        thread that owns it.
+
+        Args:
+            items: (company_id, branding) pairs.
+            max_workers: Maximum concurrent downloads.
+
+        Returns the number of logos stored.
+        """
+        targets: list[tuple[int, str]] = []
+        for company_id, branding in items:
+            logo_url = extract_branding_logo_url(branding)
+            if logo_url:
+                targets.append((company_id, logo_url))
+            else:
+                logger.debug("no_branding_logo_url", company_id=company_id)
+
+        if not targets:
+            return 0
+
+        downloads: list[tuple[int, str, bytes]] = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+            futures = {
+                executor.submit(self._download, company_id, logo_url): (company_id, logo_url)
+                for company_id, logo_url in targets
+            }
+            for future in as_completed(futures):
+                company_id, logo_url = futures[future]
+                content = future.result()
+                if content is not None:
+                    downloads.append((company_id, logo_url, content))
 
-    def _download_and_store(self, company_id: int, logo_url: str) -> bool:
-        """Download image from URL, compute hash, store in database."""
+        return self._store_many(downloads)
+
+    def _download(self, company_id: int, logo_url: str) -> bytes | None:
+        """Download a raster logo, or None if the download should be skipped."""
         try:
-            response = requests.get(
-                logo_url,
-                timeout=_REQUEST_TIMEOUT,
-                headers={"User-Agent": _USER_AGENT},
+            response = self.session.get(
+                logo_url, timeout=(_CONNECT_TIMEOUT, _REQUEST_TIMEOUT), stream=True
             )
             response.raise_for_status()
         except Exception as exc:
@@ -91,8 +208,132 @@ class BrandingLogoProcessor:
                 url=logo_url,
                 error=str(exc),
             )
+            return None
+
+        try:
+            return self._read_image_body(company_id, logo_url, response)
+        finally:
+            response.close()
+
+    def _store_many(self, downloads: list[tuple[int, str, bytes]]) -> int:
+        """Decode, hash and store downloaded logos. Returns the number stored.
+
+        Images not seen before in this run are decoded and resized one by
+        one, then perceptual-hashed together in a single vectorized pass.
+        An image that fails to decode, hash or encode is logged and dropped
+        on its own; the rest of the batch is still stored.
+        """
+        digests = [hashlib.blake2b(content, digest_size=16).digest() for _, _, content in downloads]
+
+        pending: dict[bytes, tuple[int, str, Image.Image, int, int]] = {}
+        for (company_id, logo_url, content), digest in zip(downloads, digests, strict=True):
+            if digest in self._processed_cache or digest in pending:
+                continue
+            prepared = self._prepare_image(company_id, logo_url, content)
+            if prepared is not None:
+                pending[digest] = (company_id, logo_url, *prepared)
+
+        phashes = self._hash_pending(pending)
+        processed_now: dict[bytes, _ProcessedLogo] = {}
+        for digest, (company_id, logo_url, image, width, height) in pending.items():
+            phash = phashes.get(digest)
+            if phash is None:
+                continue
+            processed = self._finish_image(company_id, logo_url, image, width, height, phash)
+            if processed is not None:
+                processed_now[digest] = processed
+                self._remember(digest, processed)
+
+        stored = 0
+        for (company_id, logo_url, _), digest in zip(downloads, digests, strict=True):
+            cached = processed_now.get(digest) or self._processed_cache.get(digest)
+            if cached is None:
+                continue
+            if digest in self._processed_cache:
+                self._processed_cache.move_to_end(digest)
+            if self._store_processed(company_id, logo_url, cached):
+                stored += 1
+        return stored
+
+    def _hash_pending(
+        self,
+        pending: dict[bytes, tuple[int, str, Image.Image, int, int]],
+    ) -> dict[bytes, str]:
+        """Perceptual-hash pending images, keyed by content digest.
+
+        Hashes the whole batch at once; if that fails, falls back to hashing
+        one image at a time so only the images that fail are logged and dropped.
+        """
+        try:
+            phashes = compute_perceptual_hashes([entry[2] for entry in pending.values()])
+            return dict(zip(pending, phashes, strict=True))
+        except Exception:
+            logger.debug("branding_logo_batch_hash_failed", count=len(pending))
+
+        hashed: dict[bytes, str] = {}
+        for digest, (company_id, logo_url, image, _, _) in pending.items():
+            try:
+                hashed[digest] = compute_perceptual_hash(image)
+            except Exception as exc:
+                logger.warning(
+                    "branding_logo_processing_failed",
+                    company_id=company_id,
+                    url=logo_url,
+                    error=str(exc),
+                )
+        return hashed
+
+    def _store_processed(
+        self,
+        company_id: int,
+        logo_url: str,
+        processed: _ProcessedLogo,
+    ) -> bool:
+        """Write one processed logo to the company_logos table."""
+        try:
+            self.logo_repo.store_company_logo(
+                {
+                    "company_id": company_id,
+                    "image_data": processed.image_base64.encode("utf-8"),
+                    "image_format": "PNG",
+                    "perceptual_hash": processed.perceptual_hash,
+                    "source_url": logo_url,
+                    "extraction_location": "branding",
+                    "width": processed.width,
+                    "height": processed.height,
+                    "extracted_at": datetime.now(tz=UTC).isoformat(),
+                }
+            )
+        except Exception as exc:
+            logger.warning(
+                "branding_logo_processing_failed",
+                company_id=company_id,
+                url=logo_url,
+                error=str(exc),
+            )
             return False
 
+        logger.info(
+            "branding_logo_stored",
+            company_id=company_id,
+            source_url=logo_url,
+            phash=processed.perceptual_hash,
+        )
+        return True
+
+    def _read_image_body(
+        self,
+        company_id: int,
+        logo_url: str,
+        response: requests.Response,
+    ) -> bytes | None:
+        """Read a streamed raster image body, or None if it should be skipped.
+
+        Non-image, SVG and oversized responses are rejected from the headers
+        alone, before the body is downloaded. The body is read in chunks and
+        abandoned as soon as it exceeds the size cap; bodies without a known
+        raster signature are rejected before decoding.
+        """
         content_type = response.headers.get("Content-Type", "")
         if "image" not in content_type and "svg" not in content_type:
             logger.debug(
@@ -101,7 +342,7 @@ class BrandingLogoProcessor:
                 url=logo_url,
                 content_type=content_type,
             )
-            return False
+            return None
 
         # SVG files cannot be processed by PIL (raster-only)
         if "svg" in content_type or logo_url.lower().endswith(".svg"):
@@ -110,10 +351,70 @@ class BrandingLogoProcessor:
                 company_id=company_id,
                 url=logo_url,
             )
-            return False
+            return None
+
+        declared = response.headers.get("Content-Length", "")
+        if declared.isdigit() and int(declared) > _MAX_LOGO_BYTES:
+            logger.debug(
+                "branding_logo_too_large",
+                company_id=company_id,
+                url=logo_url,
+                size=int(declared),
+            )
+            return None
+
+        chunks: list[bytes] = []
+        received = 0
+        try:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                received += len(chunk)
+                if received > _MAX_LOGO_BYTES:
+                    break
+                chunks.append(chunk)
+        except Exception as exc:
+            logger.warning(
+                "branding_logo_download_failed",
+                company_id=company_id,
+                url=logo_url,
+                error=str(exc),
+            )
+            return None
+
+        if received > _MAX_LOGO_BYTES:
+            logger.debug(
+                "branding_logo_too_large",
+                company_id=company_id,
+                url=logo_url,
+                size=received,
+            )
+            return None
+        content = b"".join(chunks)
+
+        # Servers often label HTML error pages or SVG as image/*; reject them
+        # from the signature before digesting or decoding anything.
+        if sniff_image_format(content) is None:
+            logger.debug(
+                "branding_logo_not_raster",
+                company_id=company_id,
+                url=logo_url,
+                content_type=content_type,
+            )
+            return None
+        return content
+
+    def _prepare_image(
+        self,
+        company_id: int,
+        logo_url: str,
+        content: bytes,
+    ) -> tuple[Image.Image, int, int] | None:
+        """Decode, validate and resize raw image bytes.
 
+        Returns (resized image, original width, original height), or None
+        when the image cannot be decoded or has an implausible size.
+        """
         try:
-            image = image_from_bytes(response.content)
+            image = image_from_bytes(content)
 
             if not is_valid_logo_size(image):
                 logger.debug(
@@ -121,51 +422,45 @@ class BrandingLogoProcessor:
                     company_id=company_id,
                     size=image.size,
                 )
-                return False
+                return None
 
             width, height = get_image_dimensions(image)
-            resized = resize_image(image.copy(), max_width=256, max_height=256)
-            phash = compute_perceptual_hash(resized)
-
-            # Reject known third-party logos by perceptual hash
-            if phash in _SKIP_PERCEPTUAL_HASHES:
-                logger.debug(
-                    "branding_logo_third_party_hash",
-                    company_id=company_id,
-                    phash=phash,
-                )
-                return False
-
-            # Encode as PNG for storage
-            try:
-                image_base64 = encode_image_to_base64(resized, format="PNG")
-            except Exception:
-                # Some images (CMYK, P mode) need conversion
-                converted = resized.convert("RGBA")
-                image_base64 = encode_image_to_base64(converted, format="PNG")
-
-            self.logo_repo.store_company_logo(
-                {
-                    "company_id": company_id,
-                    "image_data": image_base64.encode("utf-8"),
-                    "image_format": "PNG",
-                    "perceptual_hash": phash,
-                    "source_url": logo_url,
-                    "extraction_location": "branding",
-                    "width": width,
-                    "height": height,
-                    "extracted_at": datetime.now(tz=UTC).isoformat(),
-                }
+            # Thumbnail the lazily-opened image in place rather than a copy: copy()
+            # forces a full-resolution decode, while an unloaded image lets Pillow
+            # decode JPEGs directly at a reduced scale (draft mode).
+            resized = resize_image(image, max_width=256, max_height=256)
+            resized.load()
+        except Exception as exc:
+            logger.warning(
+                "branding_logo_processing_failed",
+                company_id=company_id,
+                url=logo_url,
+                error=str(exc),
             )
+            return None
+        return resized, width, height
 
-            logger.info(
-                "branding_logo_stored",
+    def _finish_image(
+        self,
+        company_id: int,
+        logo_url: str,
+        resized: Image.Image,
+        width: int,
+        height: int,
+        phash: str,
+    ) -> _ProcessedLogo | None:
+        """Apply the third-party hash filter and encode the logo for storage."""
+        # Reject known third-party logos by perceptual hash
+        if phash in _SKIP_PERCEPTUAL_HASHES:
+            logger.debug(
+                "branding_logo_third_party_hash",
                 company_id=company_id,
-                source_url=logo_url,
                 phash=phash,
             )
-            return True
+            return None
 
+        try:
+            image_base64 = _encode_png(resized)
         except Exception as exc:
             logger.warning(
                 "branding_logo_processing_failed",
@@ -173,4 +468,17 @@ class BrandingLogoProcessor:
                 url=logo_url,
                 error=str(exc),
             )
-            return False
+            return None
+
+        return _ProcessedLogo(
+            perceptual_hash=phash,
+            width=width,
+            height=height,
+            image_base64=image_base64,
+        )
+
+    def _remember(self, digest: bytes, processed: _ProcessedLogo) -> None:
+        """Store a processed logo, evicting the least recently used entry."""
+        self._processed_cache[digest] = processed
+        if len(self._processed_cache) > _PROCESSED_CACHE_SIZE:
+            self._processed_cache.popitem(last=False)
@@ -14,11 +14,16 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any
+from functools import partial
+from html import unescape
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import structlog
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -107,6 +112,75 @@ _LOGO_GRID_CLASS_PATTERNS: list[str] = [
 ]
 
 
+# Raw-HTML markers per strategy, in priority order (JSON-LD, header/nav,
+# logo keyword img, favicon, og:image). A strategy whose markers are all
+# absent from the lowercased page cannot match and is skipped.
+_STRATEGY_MARKERS: tuple[tuple[str, ...], ...] = (
+    ("ld+json",),
+    ("<header", "<nav"),
+    ("logo", "brand"),
+    ("icon",),
+    ("og:image",),
+)
+_FAVICON_ONLY: tuple[bool, ...] = (False, False, False, True, False)
+
+# <link> tags the HTML parser would see. Comments, CDATA, <!...> declarations
+# and script/style bodies are matched first so tags inside them are skipped,
+# as html.parser does. Group 2 is a <link> tag; group 3 is an opener with no
+# terminator, whose handling is left to the parser.
+_LINK_TAG_RE = re.compile(
+    r"<!--.*?--\s*>"
+    r"|<!\[CDATA\[.*?\]\]>"
+    r"|<![^>]*>"
+    r"|<(script|style)\b.*?</\1\s*>"
+    r"""|(<link\b(?:[^>"']|"[^"]*"|'[^']*')*>)"""
+    r"|(<!|<script\b|<style\b|<link\b)",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+
+def _raw_link_tags(html: str) -> list[str] | None:
+    """Return the <link> tags an HTML parser would see, without parsing.
+
+    Returns None when the page has an unterminated comment, declaration or
+    script/style block, or a malformed <link> tag, whose reading only the
+    parser can decide.
+    """
+    tags: list[str] = []
+    for _, tag, unterminated in _LINK_TAG_RE.findall(html):
+        if unterminated or "<" in tag[1:]:
+            return None
+        if tag:
+            tags.append(tag)
+    return tags
+
+
+def _favicon_from_link_tags(link_tags: list[str]) -> dict[str, Any] | None:
+    """Favicon strategy over raw <link> tags.
+
+    Mirrors LogoService._try_favicon: apple-touch-icon beats any other
+    icon, and third-party URLs are skipped.
+    """
+    icons: list[tuple[str, str]] = []
+    for tag in link_tags:
+        attrs = {
+            name.lower(): unescape(dq or sq or bare)
+            for name, dq, sq, bare in _TAG_ATTR_RE.findall(tag)
+        }
+        rel = attrs.get("rel", "").lower()
+        href = attrs.get("href", "")
+        if "icon" in rel and href and not _is_third_party_logo(href):
+            icons.append((rel, href))
+
+    for rel, href in icons:
+        if "apple-touch-icon" in rel:
+            return {"source_url": href, "extraction_location": "favicon"}
+    if icons:
+        return {"source_url": icons[0][1], "extraction_location": "favicon"}
+    return None
+
+
 def _is_third_party_logo(url: str, alt: str = "") -> bool:
     """Check if a URL or alt text indicates a third-party logo."""
     url_lower = url.lower()
@@ -207,37 +281,32 @@ class LogoService:
 
         Returns dict with source_url and extraction_location, or None.
         """
+        html_lower = html.lower()
+        possible = tuple(
+            any(marker in html_lower for marker in markers) for markers in _STRATEGY_MARKERS
+        )
+        if not any(possible):
+            return None
+        if possible == _FAVICON_ONLY:
+            # Nothing but a favicon can match: scan the raw <link> tags
+            # instead of building a parse tree.
+            link_tags = _raw_link_tags(html)
+            if link_tags is not None:
+                return _favicon_from_link_tags(link_tags)
+
         from bs4 import BeautifulSoup
 
         soup = BeautifulSoup(html, "html.parser")
-
-        # Strategy 0: JSON-LD schema.org Organization logo
-        result = self._try_jsonld_logo(soup)
-        if result:
-            return result
-
-        # Strategy 1: Header/nav image linked to homepage
-        result = self._try_header_nav_logo(soup, base_url)
-        if result:
-            return result
-
-        # Strategy 2: First img with "logo" in class/id/alt
-        # (outside third-party sections)
-        result = self._try_logo_keyword_img(soup)
-        if result:
-            return result
-
-        # Strategy 3: Favicon / apple-touch-icon
-        result = self._try_favicon(soup)
-        if result:
-            return result
-
-        # Strategy 4: og:image (lowest priority)
-        result = self._try_og_image(soup)
-        if result:
-            return result
-
-        return None
+        strategies: tuple[Callable[[], dict[str, Any] | None], ...] = (
+            partial(self._try_jsonld_logo, soup),
+            partial(self._try_header_nav_logo, soup, base_url),
+            partial(self._try_logo_keyword_img, soup),
+            partial(self._try_favicon, soup),
+            partial(self._try_og_image, soup),
+        )
+        # Lazily evaluated: strategies after the first hit never run.
+        candidates = (strategy() for strategy, ok in zip(strategies, possible, strict=True) if ok)
+        return next(filter(None, candidates), None)
 
     def _try_jsonld_logo(self, soup: Any) -> dict[str, Any] | None:
         """Strategy 0: Extract logo from JSON-LD schema.org Organization markup.
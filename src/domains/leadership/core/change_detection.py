@@ -12,19 +12,21 @@ from enum import StrEnum
 from src.domains.monitoring.core.significance_analysis import SignificanceResult
 
 # Titles whose changes are flagged as critical (MAJOR significance)
-CRITICAL_TITLES: set[str] = {
-    "ceo",
-    "chief executive officer",
-    "founder",
-    "co-founder",
-    "cofounder",
-    "co founder",
-    "cto",
-    "chief technology officer",
-    "coo",
-    "chief operating officer",
-    "president",
-}
+CRITICAL_TITLES: frozenset[str] = frozenset(
+    {
+        "ceo",
+        "chief executive officer",
+        "founder",
+        "co-founder",
+        "cofounder",
+        "co founder",
+        "cto",
+        "chief technology officer",
+        "coo",
+        "chief operating officer",
+        "president",
+    }
+)
 
 
 class LeadershipChangeType(StrEnum):
@@ -42,6 +44,17 @@ class LeadershipChangeType(StrEnum):
     NO_CHANGE = "no_change"
 
 
+_SEVERITY_BY_CHANGE_TYPE: dict[LeadershipChangeType, str] = {
+    LeadershipChangeType.CEO_DEPARTURE: "critical",
+    LeadershipChangeType.FOUNDER_DEPARTURE: "critical",
+    LeadershipChangeType.CTO_DEPARTURE: "critical",
+    LeadershipChangeType.COO_DEPARTURE: "critical",
+    LeadershipChangeType.NEW_CEO: "notable",
+    LeadershipChangeType.NEW_LEADERSHIP: "notable",
+    LeadershipChangeType.EXECUTIVE_DEPARTURE: "notable",
+}
+
+
 def _classify_departure(title: str) -> LeadershipChangeType:
     """Classify a departure by title."""
     lower = title.strip().lower()
@@ -128,24 +141,7 @@ def classify_change_severity(
         "notable" -- other executive departures, new CEO, new leadership
         "minor" -- lower-level changes (should not normally reach here)
     """
-    departure_types = {
-        LeadershipChangeType.CEO_DEPARTURE,
-        LeadershipChangeType.FOUNDER_DEPARTURE,
-        LeadershipChangeType.CTO_DEPARTURE,
-        LeadershipChangeType.COO_DEPARTURE,
-    }
-
-    if change_type in departure_types:
-        return "critical"
-
-    if change_type in (
-        LeadershipChangeType.NEW_CEO,
-        LeadershipChangeType.NEW_LEADERSHIP,
-        LeadershipChangeType.EXECUTIVE_DEPARTURE,
-    ):
-        return "notable"
-
-    return "minor"
+    return _SEVERITY_BY_CHANGE_TYPE.get(change_type, "minor")
 
 
 def build_leadership_change_summary(
@@ -40,6 +40,19 @@ LEADERSHIP_TITLES: dict[str, int] = {
     "vice president": 5,
 }
 
+# Word-boundary pattern per known title, longest first so the most specific
+# title wins when several overlap (e.g. "co-founder" before "founder").
+_KNOWN_TITLE_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(r"\b" + re.escape(title) + r"\b", re.IGNORECASE)
+    for title in sorted(LEADERSHIP_TITLES, key=len, reverse=True)
+)
+
+# Any known title at word boundaries, for membership checks only
+_ANY_KNOWN_TITLE_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(title) for title in LEADERSHIP_TITLES) + r")\b",
+    re.IGNORECASE,
+)
+
 # Pattern to match "Chief X Officer" generically
 _CHIEF_X_OFFICER_PATTERN = re.compile(
     r"\bchief\s+\w+\s+officer\b",
@@ -68,6 +81,11 @@ _NORMALIZATION_MAP: dict[str, str] = {
     "co-founder": "Co-Founder",
 }
 
+# Abbreviations that normalize_title returns upper-cased
+_TITLE_ABBREVIATIONS: frozenset[str] = frozenset(
+    {"CEO", "CTO", "COO", "CFO", "CMO", "CPO", "CRO", "CSO"}
+)
+
 _DEFAULT_RANK = 99
 
 
@@ -87,10 +105,8 @@ def is_leadership_title(title: str) -> bool:
         return True
 
     # Word-boundary match within longer strings (e.g., "CEO at Acme Corp")
-    for known_title in LEADERSHIP_TITLES:
-        pattern = re.compile(r"\b" + re.escape(known_title) + r"\b", re.IGNORECASE)
-        if pattern.search(lower):
-            return True
+    if _ANY_KNOWN_TITLE_PATTERN.search(lower):
+        return True
 
     # Generic patterns
     if _CHIEF_X_OFFICER_PATTERN.search(lower):
@@ -110,12 +126,11 @@ def extract_leadership_title(raw_text: str) -> str | None:
     text_lower = raw_text.lower()
 
     # Check for explicit titles in the text (longest match first)
-    sorted_titles = sorted(LEADERSHIP_TITLES.keys(), key=len, reverse=True)
-    for title in sorted_titles:
-        pattern = re.compile(r"\b" + re.escape(title) + r"\b", re.IGNORECASE)
-        match = pattern.search(text_lower)
-        if match:
-            return raw_text[match.start() : match.end()]
+    if _ANY_KNOWN_TITLE_PATTERN.search(text_lower):
+        for pattern in _KNOWN_TITLE_PATTERNS:
+            match = pattern.search(text_lower)
+            if match:
+                return raw_text[match.start() : match.end()]
 
     # Check for generic "Chief X Officer" pattern
     match = _CHIEF_X_OFFICER_PATTERN.search(raw_text)
@@ -144,8 +159,7 @@ def normalize_title(title: str) -> str:
 
     # Check if it's already a known abbreviation
     upper = title.strip().upper()
-    abbreviations = {"CEO", "CTO", "COO", "CFO", "CMO", "CPO", "CRO", "CSO"}
-    if upper in abbreviations:
+    if upper in _TITLE_ABBREVIATIONS:
         return upper
 
     # Capitalize known titles
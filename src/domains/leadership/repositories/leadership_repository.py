@@ -13,6 +13,13 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+_INSERT_LEADERSHIP_SQL = """INSERT INTO company_leadership
+   (company_id, person_name, title, linkedin_profile_url,
+    discovery_method, confidence, is_current, discovered_at,
+    last_verified_at, source_company_linkedin_url, performed_by)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(company_id, linkedin_profile_url) DO NOTHING"""
+
 
 class LeadershipRepository:
     """Repository for company leadership data access."""
@@ -22,43 +29,51 @@ class LeadershipRepository:
         self.operator = operator
 
     def store_leadership(self, data: dict[str, Any]) -> int:
-        """Store a leadership record. Uses explicit check to skip duplicates.
+        """Store a leadership record, skipping duplicates.
 
         Returns row ID if stored, 0 if duplicate skipped. The LinkedIn URL
         is normalized so cosmetic variants map to the same canonical form.
+        Duplicates are detected by the UNIQUE(company_id, linkedin_profile_url)
+        constraint in the same statement, so there is no check-then-insert race.
         """
-        company_id = data["company_id"]
-        profile_url = normalize_social_url(data["linkedin_profile_url"])
-
-        if self.leadership_exists(company_id, profile_url):
+        cursor = self.db.execute(_INSERT_LEADERSHIP_SQL, self._leadership_row(data))
+        self.db.connection.commit()
+        if cursor.rowcount == 0:
             logger.debug(
                 "duplicate_leadership_skipped",
-                url=profile_url,
+                url=normalize_social_url(data["linkedin_profile_url"]),
             )
             return 0
+        return cursor.lastrowid or 0
+
+    def store_leadership_many(self, records: list[dict[str, Any]]) -> int:
+        """Store many leadership records in one transaction, skipping duplicates.
 
-        cursor = self.db.execute(
-            """INSERT INTO company_leadership
-               (company_id, person_name, title, linkedin_profile_url,
-                discovery_method, confidence, is_current, discovered_at,
-                last_verified_at, source_company_linkedin_url, performed_by)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                company_id,
-                data["person_name"],
-                data["title"],
-                profile_url,
-                data["discovery_method"],
-                data.get("confidence", 0.0),
-                1 if data.get("is_current", True) else 0,
-                data["discovered_at"],
-                data.get("last_verified_at"),
-                data.get("source_company_linkedin_url"),
-                self.operator,
-            ),
+        Returns the number of new rows inserted.
+        """
+        if not records:
+            return 0
+        with self.db.transaction() as cursor:
+            cursor.executemany(
+                _INSERT_LEADERSHIP_SQL, [self._leadership_row(data) for data in records]
+            )
+            return cursor.rowcount
+
+    def _leadership_row(self, data: dict[str, Any]) -> tuple[Any, ...]:
+        """Build the insert parameters for one leadership record."""
+        return (
+            data["company_id"],
+            data["person_name"],
+            data["title"],
+            normalize_social_url(data["linkedin_profile_url"]),
+            data["discovery_method"],
+            data.get("confidence", 0.0),
+            1 if data.get("is_current", True) else 0,
+            data["discovered_at"],
+            data.get("last_verified_at"),
+            data.get("source_company_linkedin_url"),
+            self.operator,
         )
-        self.db.connection.commit()
-        return cursor.lastrowid or 0
 
     def get_leadership_for_company(self, company_id: int) -> list[dict[str, Any]]:
         """Get all leadership records for a company (current and past)."""
@@ -104,6 +119,29 @@ class LeadershipRepository:
             url=normalized,
         )
 
+    def mark_not_current_many(self, company_id: int, linkedin_profile_urls: list[str]) -> int:
+        """Mark several departed leaders as not current in one transaction.
+
+        Returns the number of rows updated.
+        """
+        if not linkedin_profile_urls:
+            return 0
+        normalized = [normalize_social_url(url) for url in linkedin_profile_urls]
+        with self.db.transaction() as cursor:
+            cursor.executemany(
+                """UPDATE company_leadership
+                   SET is_current = 0, performed_by = ?
+                   WHERE company_id = ? AND linkedin_profile_url = ?""",
+                [(self.operator, company_id, url) for url in normalized],
+            )
+            updated = cursor.rowcount
+        logger.info(
+            "leadership_marked_not_current",
+            company_id=company_id,
+            count=updated,
+        )
+        return updated
+
     def update_verification_date(
         self, company_id: int, linkedin_profile_url: str, last_verified_at: str
     ) -> None:
@@ -158,4 +158,4 @@ class LinkedInSnapshotRepository:
 
 def _compute_checksum(content: str) -> str:
     """Compute MD5 checksum of content (lowercase hex, 32 chars)."""
-    return hashlib.md5(content.encode("utf-8")).hexdigest()
+    return hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest()
@@ -12,6 +12,7 @@ import base64
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -31,9 +32,12 @@ from src.domains.leadership.services.cdp_browser import CDPBlockedError
 from src.utils.progress import ProgressTracker
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.domains.discovery.repositories.social_media_link_repository import (
         SocialMediaLinkRepository,
     )
+    from src.domains.leadership.core.change_detection import LeadershipChangeType
     from src.domains.leadership.repositories.leadership_change_repository import (
         LeadershipChangeRepository,
     )
@@ -128,36 +132,59 @@ class LeadershipManager:
 
         # Fallback to Kagi search if CDP didn't produce results
         if not people:
-            try:
-                people = self.search.search_leadership(company_name)
-                method_used = "kagi_search"
-                logger.info(
-                    "kagi_fallback_used",
-                    company=company_name,
-                    leaders_found=len(people),
-                )
-            except Exception as exc:
-                logger.error(
-                    "kagi_search_failed",
-                    company=company_name,
-                    error=str(exc),
-                )
-                errors.append(f"Kagi search error: {exc}")
+            people = self._search_via_kagi(company_name, errors)
+            method_used = "kagi_search"
+
+        return self._store_leadership_results(
+            company_id, company_name, linkedin_company_url, people, method_used, errors
+        )
+
+    def _search_via_kagi(self, company_name: str, errors: list[str]) -> list[dict[str, str]]:
+        """Search Kagi for a company's leaders. Touches neither the DB nor the browser.
+
+        Failures are logged and appended to errors; an empty list is returned.
+        """
+        try:
+            people = self.search.search_leadership(company_name)
+        except Exception as exc:
+            logger.error(
+                "kagi_search_failed",
+                company=company_name,
+                error=str(exc),
+            )
+            errors.append(f"Kagi search error: {exc}")
+            return []
+        logger.info(
+            "kagi_fallback_used",
+            company=company_name,
+            leaders_found=len(people),
+        )
+        return people
 
+    def _store_leadership_results(
+        self,
+        company_id: int,
+        company_name: str,
+        linkedin_company_url: str | None,
+        people: list[dict[str, str]],
+        method_used: str,
+        errors: list[str],
+    ) -> dict[str, Any]:
+        """Store extracted leaders, detect and record changes, build the summary dict."""
         # Get previous leadership for change detection
         previous_leadership = self.leadership_repo.get_current_leadership(company_id)
 
         # Store results
         now = datetime.now(UTC).isoformat()
         confidence = 0.8 if method_used == "cdp_scrape" else 0.6
-        stored_count = 0
+        records: list[dict[str, Any]] = []
 
         for person in people:
             profile_url = normalize_social_url(person.get("profile_url", ""))
             if not profile_url:
                 continue
 
-            self.leadership_repo.store_leadership(
+            records.append(
                 {
                     "company_id": company_id,
                     "person_name": person.get("name", "Unknown"),
@@ -171,7 +198,8 @@ class LeadershipManager:
                     "source_company_linkedin_url": linkedin_company_url,
                 }
             )
-            stored_count += 1
+        self.leadership_repo.store_leadership_many(records)
+        stored_count = len(records)
 
         # Detect leadership changes
         current_as_dicts = [
@@ -218,13 +246,17 @@ class LeadershipManager:
                     error=str(exc),
                 )
 
-        # Mark departed leaders
+        # Mark departed leaders and collect critical changes in one pass
+        departed_urls: list[str] = []
+        critical_changes: list[dict[str, str | LeadershipChangeType]] = []
         for change in changes:
-            change_type = str(change.get("change_type", ""))
-            if change_type.endswith("_departure"):
+            if str(change.get("change_type", "")).endswith("_departure"):
                 profile_url = str(change.get("profile_url", ""))
                 if profile_url:
-                    self.leadership_repo.mark_not_current(company_id, profile_url)
+                    departed_urls.append(profile_url)
+            if change.get("severity") == "critical":
+                critical_changes.append(change)
+        self.leadership_repo.mark_not_current_many(company_id, departed_urls)
 
         # Verify leaders who were previously known but not in current People tab
         verification_results: list[dict[str, Any]] = []
@@ -234,16 +266,14 @@ class LeadershipManager:
             )
 
         # Log critical changes prominently
-        critical_changes = [c for c in changes if c.get("severity") == "critical"]
-        if critical_changes:
-            for change in critical_changes:
-                logger.warning(
-                    "critical_leadership_change",
-                    company=company_name,
-                    change_type=str(change.get("change_type", "")),
-                    person=str(change.get("person_name", "")),
-                    title=str(change.get("title", "")),
-                )
+        for change in critical_changes:
+            logger.warning(
+                "critical_leadership_change",
+                company=company_name,
+                change_type=str(change.get("change_type", "")),
+                person=str(change.get("person_name", "")),
+                title=str(change.get("title", "")),
+            )
 
         # Build leader detail list for report
         leader_details: list[dict[str, Any]] = []
@@ -416,8 +446,9 @@ class LeadershipManager:
         Args:
             limit: Process only the first N companies.
             max_workers: Number of parallel workers. Default 1 because
-                CDP browser is single-threaded. Use higher values
-                only when using Kagi-only mode (no browser).
+                CDP browser is single-threaded. Higher values switch to
+                Kagi-only mode: searches run in parallel without the browser,
+                then results are stored sequentially.
             exclude_company_ids: Company IDs to exclude (e.g. manually closed).
 
         Returns aggregate summary with report_details for report generation.
@@ -461,60 +492,48 @@ class LeadershipManager:
                 # Delay between companies
                 self.browser.delay_between_pages()
         else:
-            # Parallel mode (for Kagi-only workflows)
+            # Parallel mode (Kagi-only): LinkedIn URLs are resolved up front and
+            # results stored afterwards on this thread, since the SQLite
+            # connection and the CDP browser are both single-threaded.
+            linkedin_urls = {
+                company["id"]: self._find_linkedin_company_url(company["id"])
+                for company in companies
+            }
+            search_errors: dict[int, list[str]] = {company["id"]: [] for company in companies}
+
+            # Phase 1: Parallel Kagi search (no DB access in worker threads)
+            search_results: dict[int, list[dict[str, str]]] = {}
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = {
-                    executor.submit(self.extract_company_leadership, company["id"]): company
+                    executor.submit(
+                        self._search_via_kagi, company["name"], search_errors[company["id"]]
+                    ): company
                     for company in companies
                 }
-
                 for future in as_completed(futures):
-                    company = futures[future]
-                    try:
-                        result = future.result()
-                        if result.get("error"):
-                            tracker.record_failure(result["error"])
-                            failed_details.append(
-                                {
-                                    "company_id": company["id"],
-                                    "name": company.get("name", ""),
-                                    "error": result["error"],
-                                }
-                            )
-                        else:
-                            total_leaders += result.get("leaders_found", 0)
-                            for change in result.get("leadership_changes", []):
-                                if change.get("severity") == "critical":
-                                    all_critical_changes.append(
-                                        {**change, "company_name": company["name"]}
-                                    )
-                            tracker.record_success()
-                            extracted_details.append(
-                                {
-                                    "company_id": result["company_id"],
-                                    "name": result["company_name"],
-                                    "method_used": result["method_used"],
-                                    "leaders_found": result["leaders_found"],
-                                    "leaders": result.get("leaders", []),
-                                    "leadership_changes": result.get("leadership_changes", []),
-                                }
-                            )
-                    except Exception as exc:
-                        logger.error(
-                            "leadership_extraction_failed",
-                            company=company["name"],
-                            error=str(exc),
-                        )
-                        tracker.record_failure(str(exc))
-                        failed_details.append(
-                            {
-                                "company_id": company["id"],
-                                "name": company.get("name", ""),
-                                "error": str(exc),
-                            }
-                        )
-
-                    tracker.log_progress(every_n=1)
+                    search_results[futures[future]["id"]] = future.result()
+
+            # Phase 2: Sequential storage + change detection, in company order
+            for company in companies:
+                company_id = company["id"]
+                total_leaders += self._process_company_leadership(
+                    company,
+                    tracker,
+                    all_critical_changes,
+                    extracted_details,
+                    failed_details,
+                    skipped_details,
+                    extract=partial(
+                        self._store_leadership_results,
+                        company_id,
+                        company["name"],
+                        linkedin_urls[company_id],
+                        search_results[company_id],
+                        "kagi_search",
+                        search_errors[company_id],
+                    ),
+                )
+                tracker.log_progress(every_n=1)
 
         raw_summary = tracker.summary()
         aggregate: dict[str, Any] = {**raw_summary}
@@ -535,13 +554,17 @@ class LeadershipManager:
         extracted_details: list[dict[str, Any]],
         failed_details: list[dict[str, Any]],
         skipped_details: list[dict[str, Any]],
+        extract: Callable[[], dict[str, Any]] | None = None,
     ) -> int:
-        """Process a single company's leadership extraction (sequential mode helper).
+        """Process a single company's leadership extraction and record the outcome.
+
+        extract defaults to a full extract_company_leadership() run; parallel
+        mode passes the storage step for results it has already searched.
 
         Returns number of leaders found.
         """
         try:
-            result = self.extract_company_leadership(company["id"])
+            result = extract() if extract else self.extract_company_leadership(company["id"])
             if result.get("error"):
                 tracker.record_failure(result["error"])
                 failed_details.append(
@@ -8,6 +8,8 @@ import hashlib
 def compute_content_checksum(content: str) -> str:
     """Compute MD5 hex digest of content string.
 
-    Returns lowercase 32-character hex string.
+    Returns lowercase 32-character hex string. MD5 is part of the stored
+    format: change detection compares against checksums already in the
+    database, so switching algorithms would flag every company as changed.
     """
-    return hashlib.md5(content.encode("utf-8")).hexdigest()
+    return hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import cache
 
 # --- Keyword Dictionaries ---
 
@@ -345,6 +346,13 @@ class SignificanceResult:
     evidence_snippets: list[str] = field(default_factory=list)
 
 
+@cache
+def _keyword_pattern(keyword: str) -> re.Pattern[str]:
+    """Word-boundary pattern for a keyword, compiled once per process."""
+    # Use word boundary matching to avoid partial matches
+    return re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE)
+
+
 def find_keyword_matches(
     content: str,
     keywords: dict[str, list[str]],
@@ -358,9 +366,10 @@ def find_keyword_matches(
 
     for category, terms in keywords.items():
         for keyword in terms:
-            # Use word boundary matching to avoid partial matches
-            pattern = re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE)
-            for match in pattern.finditer(content_lower):
+            # A plain substring test rules out most keywords before any regex runs
+            if keyword.lower() not in content_lower:
+                continue
+            for match in _keyword_pattern(keyword).finditer(content_lower):
                 position = match.start()
                 context_start = max(0, position - 50)
                 context_end = min(len(content), match.end() + 50)
@@ -417,16 +426,19 @@ def detect_false_positives(
 
     False positives reduce confidence by 30%.
     """
+    if not matches:
+        return matches
     content_lower = content.lower()
+    # Locate each false positive phrase once, not once per match
+    fp_spans: list[tuple[int, int]] = []
+    for fp_phrase in FALSE_POSITIVE_PHRASES:
+        fp_start = content_lower.find(fp_phrase)
+        if fp_start != -1:
+            fp_spans.append((fp_start, fp_start + len(fp_phrase)))
     for match in matches:
-        for fp_phrase in FALSE_POSITIVE_PHRASES:
-            # Check if the keyword is part of a known false positive phrase
-            fp_start = content_lower.find(fp_phrase)
-            if fp_start != -1:
-                fp_end = fp_start + len(fp_phrase)
-                if fp_start <= match.position < fp_end:
-                    match.is_false_positive = True
-                    break
+        # Check if the keyword is part of a known false positive phrase
+        if any(fp_start <= match.position < fp_end for fp_start, fp_end in fp_spans):
+            match.is_false_positive = True
     return matches
 
 
@@ -20,6 +20,16 @@ class SignalType(StrEnum):
     NEUTRAL = "neutral"
 
 
+# One pattern per copyright marker rather than a single alternation: each then
+# starts with a literal, which the regex engine locates with a fast substring
+# search instead of attempting the alternation at every offset. Only the
+# highest year is kept, so scanning per marker gives the same result.
+_COPYRIGHT_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(re.escape(marker) + r"\s*(\d{4})(?:\s*[-\u2013]\s*(\d{4}))?")
+    for marker in ("(c)", "(C)", "Copyright", "copyright", "©")
+)
+
+
 def extract_copyright_year(content: str) -> int | None:
     """Extract the highest copyright year from content.
 
@@ -27,13 +37,9 @@ def extract_copyright_year(content: str) -> int | None:
     Supports year ranges (e.g., 2020-2025). Returns highest year found.
     Requires a copyright marker before the year.
     """
-    patterns = [
-        r"(?:\(c\)|\(C\)|[Cc]opyright|©)\s*(\d{4})(?:\s*[-\u2013]\s*(\d{4}))?",
-    ]
-
     max_year: int | None = None
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
+    for pattern in _COPYRIGHT_PATTERNS:
+        for match in pattern.finditer(content):
             year1 = int(match.group(1))
             year2_str = match.group(2)
             year = int(year2_str) if year2_str else year1
@@ -100,8 +106,12 @@ def detect_acquisition(content: str) -> tuple[bool, str | None]:
             if idx == -1:
                 break
             if pattern == "sold to":
-                after = content_lower[idx + len(pattern) :].lstrip()
-                if any(after.startswith(follower) for follower in _SOLD_TO_COMMERCE_FOLLOWERS):
+                # Skip whitespace in place rather than slicing the rest of
+                # the page for every hit.
+                after = idx + len(pattern)
+                while after < len(content_lower) and content_lower[after].isspace():
+                    after += 1
+                if content_lower.startswith(_SOLD_TO_COMMERCE_FOLLOWERS, after):
                     search_start = idx + len(pattern)
                     continue
             start = max(0, idx - 30)
@@ -58,6 +58,21 @@ class SnapshotRepository:
         )
         return [dict(row) for row in rows]
 
+    def get_recent_snapshot_history(self, company_id: int, limit: int) -> list[dict[str, Any]]:
+        """Get error and baseline-sentiment fields of the most recent snapshots.
+
+        Newest first. Skips the page content columns, which dominate row size.
+        """
+        rows = self.db.fetchall(
+            """SELECT id, captured_at, error_message, baseline_sentiment
+               FROM snapshots
+               WHERE company_id = ?
+               ORDER BY captured_at DESC
+               LIMIT ?""",
+            (company_id, limit),
+        )
+        return [dict(row) for row in rows]
+
     def get_snapshot_by_id(self, snapshot_id: int) -> dict[str, Any] | None:
         """Get a snapshot by ID."""
         row = self.db.fetchone("SELECT * FROM snapshots WHERE id = ?", (snapshot_id,))
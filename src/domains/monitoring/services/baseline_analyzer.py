@@ -11,6 +11,9 @@ After baseline exists, all future signals come from diff-based change detection.
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -22,6 +25,9 @@ from src.domains.monitoring.core.significance_analysis import (
 from src.utils.progress import ProgressTracker
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.domains.monitoring.core.significance_analysis import SignificanceResult
     from src.domains.monitoring.repositories.snapshot_repository import SnapshotRepository
     from src.repositories.company_repository import CompanyRepository
 
@@ -45,17 +51,16 @@ class BaselineAnalyzer:
         self.llm_client = llm_client
         self.llm_enabled = llm_enabled
 
-    def analyze_baseline_for_snapshot(self, snapshot_id: int) -> dict[str, Any] | None:
-        """Run baseline analysis on a single snapshot.
+    def _classify_baseline(
+        self,
+        snapshot: dict[str, Any],
+        company: dict[str, Any] | None,
+    ) -> SignificanceResult:
+        """Classify a snapshot's full content: keywords first, LLM as primary when enabled.
 
-        Returns the baseline data dict, or None if snapshot not found or has no content.
+        Touches no repository, so backfill can run it on worker threads.
         """
-        snapshot = self.snapshot_repo.get_snapshot_by_id(snapshot_id)
-        if not snapshot or not snapshot.get("content_markdown"):
-            return None
-
         company_id = snapshot["company_id"]
-        company = self.company_repo.get_company_by_id(company_id)
         company_name = company["name"] if company else f"Company {company_id}"
         company_url = company.get("homepage_url", "") if company else ""
 
@@ -86,18 +91,24 @@ class BaselineAnalyzer:
             except Exception as exc:
                 logger.warning(
                     "llm_baseline_classification_failed",
-                    snapshot_id=snapshot_id,
+                    snapshot_id=snapshot["id"],
                     error=str(exc),
                 )
 
-        baseline_data: dict[str, Any] = {
-            "baseline_classification": result.classification,
-            "baseline_sentiment": result.sentiment,
-            "baseline_confidence": result.confidence,
-            "baseline_keywords": result.matched_keywords,
-            "baseline_categories": result.matched_categories,
-            "baseline_notes": result.notes,
-        }
+        return result
+
+    def analyze_baseline_for_snapshot(self, snapshot_id: int) -> dict[str, Any] | None:
+        """Run baseline analysis on a single snapshot.
+
+        Returns the baseline data dict, or None if snapshot not found or has no content.
+        """
+        snapshot = self.snapshot_repo.get_snapshot_by_id(snapshot_id)
+        if not snapshot or not snapshot.get("content_markdown"):
+            return None
+
+        company = self.company_repo.get_company_by_id(snapshot["company_id"])
+        result = self._classify_baseline(snapshot, company)
+        baseline_data = _baseline_data(result)
 
         self.snapshot_repo.update_baseline(snapshot_id, baseline_data)
 
@@ -129,9 +140,16 @@ class BaselineAnalyzer:
         self,
         limit: int | None = None,
         dry_run: bool = False,
+        max_workers: int = 1,
     ) -> dict[str, Any]:
         """Batch baseline analysis for companies missing baselines.
 
+        Args:
+            limit: Process first N snapshots.
+            dry_run: Classify without writing baselines.
+            max_workers: Concurrent LLM classifications. Only used when the
+                LLM is enabled; results are always stored on the calling thread.
+
         Returns summary stats.
         """
         snapshots = self.snapshot_repo.get_snapshots_without_baseline()
@@ -141,74 +159,134 @@ class BaselineAnalyzer:
 
         tracker = ProgressTracker(total=len(snapshots))
 
+        # Snapshots that may become each company's baseline, in order. Later
+        # ones are only used if an earlier one fails, or in a dry run (where
+        # nothing is stored, so every snapshot is classified).
+        candidates: dict[int, deque[dict[str, Any]]] = {}
         for snapshot in snapshots:
             try:
                 company_id = snapshot["company_id"]
-                if self.snapshot_repo.has_baseline_for_company(company_id):
-                    tracker.record_skip()
-                    continue
+                if company_id not in candidates:
+                    if self.snapshot_repo.has_baseline_for_company(company_id):
+                        tracker.record_skip()
+                        continue
+                    candidates[company_id] = deque()
 
-                content = snapshot.get("content_markdown")
-                if not content:
+                if not snapshot.get("content_markdown"):
                     tracker.record_skip()
                     continue
 
-                company = self.company_repo.get_company_by_id(company_id)
-                company_name = company["name"] if company else f"Company {company_id}"
-                company_url = company.get("homepage_url", "") if company else ""
+                candidates[company_id].append(snapshot)
+            except Exception as exc:
+                self._record_backfill_failure(snapshot, exc, tracker)
+
+        if max_workers <= 1 or not (self.llm_enabled and self.llm_client):
+            for queue in candidates.values():
+                while queue:
+                    snapshot = queue.popleft()
+                    classify = partial(self._lookup_and_classify, snapshot)
+                    if self._store_backfill_result(snapshot, classify, dry_run, tracker):
+                        self._skip_remaining(queue, tracker)
+        else:
+            # LLM calls overlap on worker threads, one snapshot per company at a
+            # time; each result is stored here as it completes, since the SQLite
+            # connection belongs to this thread.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                running: dict[Future[SignificanceResult], dict[str, Any]] = {}
+                for queue in candidates.values():
+                    self._submit_next_candidate(executor, queue, running, tracker)
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        snapshot = running.pop(future)
+                        queue = candidates[snapshot["company_id"]]
+                        if self._store_backfill_result(snapshot, future.result, dry_run, tracker):
+                            self._skip_remaining(queue, tracker)
+                        else:
+                            self._submit_next_candidate(executor, queue, running, tracker)
 
-                result = analyze_content_significance(
-                    content,
-                    magnitude="minor",
-                    exclude_categories=HOMEPAGE_EXCLUDED_CATEGORIES,
-                )
+        return tracker.summary()
 
-                # LLM as primary classifier for baseline -- keywords passed as hints
-                if self.llm_enabled and self.llm_client:
-                    try:
-                        llm_result = self.llm_client.classify_baseline(
-                            content_excerpt=content[:_LLM_CONTENT_LIMIT],
-                            keywords=result.matched_keywords,
-                            categories=result.matched_categories,
-                            company_name=company_name,
-                            homepage_url=company_url,
-                        )
-                        if not llm_result.get("error"):
-                            result.classification = llm_result.get(
-                                "classification", result.classification
-                            )
-                            result.sentiment = llm_result.get("sentiment", result.sentiment)
-                            result.confidence = llm_result.get("confidence", result.confidence)
-                            if llm_result.get("reasoning"):
-                                result.notes = llm_result["reasoning"]
-                    except Exception as exc:
-                        logger.warning(
-                            "llm_baseline_classification_failed",
-                            snapshot_id=snapshot["id"],
-                            error=str(exc),
-                        )
-
-                if not dry_run:
-                    baseline_data: dict[str, Any] = {
-                        "baseline_classification": result.classification,
-                        "baseline_sentiment": result.sentiment,
-                        "baseline_confidence": result.confidence,
-                        "baseline_keywords": result.matched_keywords,
-                        "baseline_categories": result.matched_categories,
-                        "baseline_notes": result.notes,
-                    }
-                    self.snapshot_repo.update_baseline(snapshot["id"], baseline_data)
-
-                tracker.record_success()
-            except Exception as exc:
-                logger.error(
-                    "baseline_analysis_failed",
-                    snapshot_id=snapshot["id"],
-                    company_id=snapshot["company_id"],
-                    error=str(exc),
-                )
-                tracker.record_failure(str(exc))
+    def _lookup_and_classify(self, snapshot: dict[str, Any]) -> SignificanceResult:
+        """Look up the snapshot's company and classify it. Calling thread only."""
+        company = self.company_repo.get_company_by_id(snapshot["company_id"])
+        return self._classify_baseline(snapshot, company)
 
-            tracker.log_progress(every_n=10)
+    def _submit_next_candidate(
+        self,
+        executor: ThreadPoolExecutor,
+        queue: deque[dict[str, Any]],
+        running: dict[Future[SignificanceResult], dict[str, Any]],
+        tracker: ProgressTracker,
+    ) -> None:
+        """Submit the next snapshot in a company's queue for classification.
 
-        return tracker.summary()
+        The company lookup stays on the calling thread; a snapshot whose
+        lookup fails is recorded as failed and the following one is tried.
+        """
+        while queue:
+            snapshot = queue.popleft()
+            try:
+                company = self.company_repo.get_company_by_id(snapshot["company_id"])
+            except Exception as exc:
+                self._record_backfill_failure(snapshot, exc, tracker)
+                continue
+            running[executor.submit(self._classify_baseline, snapshot, company)] = snapshot
+            return
+
+    def _store_backfill_result(
+        self,
+        snapshot: dict[str, Any],
+        classify: Callable[[], SignificanceResult],
+        dry_run: bool,
+        tracker: ProgressTracker,
+    ) -> bool:
+        """Obtain one snapshot's classification, store it and record the outcome.
+
+        Returns True when a baseline was written for the snapshot's company.
+        """
+        stored = False
+        try:
+            result = classify()
+            if not dry_run:
+                self.snapshot_repo.update_baseline(snapshot["id"], _baseline_data(result))
+                stored = True
+            tracker.record_success()
+        except Exception as exc:
+            self._record_backfill_failure(snapshot, exc, tracker)
+
+        tracker.log_progress(every_n=10)
+        return stored
+
+    def _skip_remaining(self, queue: deque[dict[str, Any]], tracker: ProgressTracker) -> None:
+        """Skip a company's remaining snapshots once its baseline is stored."""
+        for _ in queue:
+            tracker.record_skip()
+        queue.clear()
+
+    def _record_backfill_failure(
+        self,
+        snapshot: dict[str, Any],
+        exc: Exception,
+        tracker: ProgressTracker,
+    ) -> None:
+        """Log a snapshot whose baseline analysis failed and count it as a failure."""
+        logger.error(
+            "baseline_analysis_failed",
+            snapshot_id=snapshot["id"],
+            company_id=snapshot["company_id"],
+            error=str(exc),
+        )
+        tracker.record_failure(str(exc))
+
+
+def _baseline_data(result: SignificanceResult) -> dict[str, Any]:
+    """Map a classification result onto the snapshot baseline columns."""
+    return {
+        "baseline_classification": result.classification,
+        "baseline_sentiment": result.sentiment,
+        "baseline_confidence": result.confidence,
+        "baseline_keywords": result.matched_keywords,
+        "baseline_categories": result.matched_categories,
+        "baseline_notes": result.notes,
+    }
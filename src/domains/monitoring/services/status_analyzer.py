@@ -66,6 +66,11 @@ _NEWS_VETO_MIN_CONFIDENCE: float = 0.75
 _NEWS_LOOKBACK_DAYS: int = 90
 _LEADERSHIP_LOOKBACK_DAYS: int = 90
 
+# Snapshot windows for the error-pattern and baseline-drift indicators. Both
+# are served by a single history read of the larger window.
+_ERROR_PATTERN_WINDOW: int = 5
+_BASELINE_DRIFT_WINDOW: int = 50
+
 
 class StatusAnalyzer:
     """Orchestrates company status analysis from multiple signal sources."""
@@ -265,8 +270,17 @@ class StatusAnalyzer:
 
         return indicators
 
+    def _fetch_snapshot_history(self, company_id: int) -> list[dict[str, Any]]:
+        """Read the recent snapshot history shared by the snapshot-pattern indicators."""
+        try:
+            return self.snapshot_repo.get_recent_snapshot_history(
+                company_id, limit=_BASELINE_DRIFT_WINDOW
+            )
+        except Exception:
+            return []
+
     def _collect_error_pattern_indicators(
-        self, company_id: int
+        self, history: list[dict[str, Any]]
     ) -> list[tuple[str, str, SignalType]]:
         """Persistent snapshot capture failures.
 
@@ -276,11 +290,7 @@ class StatusAnalyzer:
         A single flaky snapshot is ignored; this only fires on
         patterns of persistent failure.
         """
-        try:
-            recent = self.snapshot_repo.get_latest_snapshots(company_id, limit=5)
-        except Exception:
-            return []
-
+        recent = history[:_ERROR_PATTERN_WINDOW]
         if len(recent) < 3:
             return []
 
@@ -294,7 +304,7 @@ class StatusAnalyzer:
         return [("error_pattern", value, SignalType.NEGATIVE)]
 
     def _collect_baseline_drift_indicators(
-        self, company_id: int
+        self, history: list[dict[str, Any]]
     ) -> list[tuple[str, str, SignalType]]:
         """Sentiment drift between the first-ever snapshot and the latest.
 
@@ -303,16 +313,12 @@ class StatusAnalyzer:
         flag it as a NEUTRAL context indicator (not strongly negative,
         because the drift could be market cycle or a single event).
         """
-        try:
-            oldest = self.snapshot_repo.get_latest_snapshots(company_id, limit=50)
-        except Exception:
-            return []
-
-        if len(oldest) < 2:
+        if len(history) < 2:
             return []
 
-        baseline = oldest[-1]  # oldest in the window
-        latest = oldest[0]
+        # history is newest-first: the last entry is the earliest in the window
+        baseline = history[-1]
+        latest = history[0]
 
         base_sentiment = (baseline.get("baseline_sentiment") or "").strip()
         if not base_sentiment or base_sentiment == "neutral":
@@ -418,8 +424,9 @@ class StatusAnalyzer:
                 indicators += self._collect_social_indicators(company_id)
                 indicators += self._collect_news_indicators(company_id, news_cache)
                 indicators += self._collect_leadership_indicators(company_id, leadership_cache)
-                indicators += self._collect_error_pattern_indicators(company_id)
-                indicators += self._collect_baseline_drift_indicators(company_id)
+                history = self._fetch_snapshot_history(company_id)
+                indicators += self._collect_error_pattern_indicators(history)
+                indicators += self._collect_baseline_drift_indicators(history)
 
                 now = datetime.now(UTC).isoformat()
 
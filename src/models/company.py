@@ -7,6 +7,8 @@ from datetime import UTC, datetime
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, model_validator
 
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
 
 def _utc_now() -> datetime:
     """Return current UTC datetime."""
@@ -38,7 +40,7 @@ class Company(BaseModel):
         if len(stripped) > 500:
             msg = "Name must not exceed 500 characters"
             raise ValueError(msg)
-        collapsed = re.sub(r"\s+", " ", stripped)
+        collapsed = _WHITESPACE_RUN_PATTERN.sub(" ", stripped)
         return collapsed.title()
 
     @field_validator("source_sheet")
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from src.services.database import Database
 
 logger = structlog.get_logger(__name__)
@@ -53,6 +55,45 @@ class CompanyRepository:
         self.db.connection.commit()
         return cursor.lastrowid or 0
 
+    def upsert_companies(
+        self,
+        companies: Sequence[tuple[str, str | None]],
+        source_sheet: str,
+    ) -> int:
+        """Insert or update many (name, homepage_url) companies in one transaction.
+
+        Same matching rules as upsert_company (a NULL homepage_url matches
+        NULL, and only the first matching row is updated), but each statement
+        is prepared once and the batch commits once. If any statement fails the
+        whole batch is rolled back and the error is raised. Returns the number
+        of companies upserted.
+        """
+        if not companies:
+            return 0
+        now = datetime.now(UTC).isoformat()
+        with self.db.transaction() as cursor:
+            cursor.executemany(
+                """UPDATE companies SET source_sheet = ?, updated_at = ?, performed_by = ?
+                   WHERE id = (
+                       SELECT id FROM companies WHERE name = ? AND homepage_url IS ? LIMIT 1
+                   )""",
+                [(source_sheet, now, self.operator, name, url) for name, url in companies],
+            )
+            cursor.executemany(
+                """INSERT INTO companies
+                   (name, homepage_url, source_sheet, flagged_for_review,
+                    flag_reason, created_at, updated_at, performed_by)
+                   SELECT ?, ?, ?, 0, NULL, ?, ?, ?
+                   WHERE NOT EXISTS (
+                       SELECT 1 FROM companies WHERE name = ? AND homepage_url IS ?
+                   )""",
+                [
+                    (name, url, source_sheet, now, now, self.operator, name, url)
+                    for name, url in companies
+                ],
+            )
+        return len(companies)
+
     def get_company_by_id(self, company_id: int) -> dict[str, Any] | None:
         """Get a company by ID."""
         row = self.db.fetchone("SELECT * FROM companies WHERE id = ?", (company_id,))
@@ -100,6 +100,15 @@ class BatchSnapshotManager:
 
                 if result["success"]:
                     returned_urls: set[str] = set()
+                    pending_logos: list[tuple[int, Any]] = []
+                    # One lookup for the whole batch instead of one per document
+                    companies_with_logos: set[int] = (
+                        self._logo_processor.company_ids_with_logos(
+                            url_to_company[url] for url in batch_urls
+                        )
+                        if self._logo_processor
+                        else set()
+                    )
 
                     for doc in result.get("documents", []):
                         doc_url = doc.get("url", "")
@@ -122,17 +131,15 @@ class BatchSnapshotManager:
                             if self.snapshot_repo.count_snapshots_for_company(company_id) == 1:
                                 self._baseline_analyzer.analyze_baseline_for_snapshot(snapshot_id)
 
-                            # Process branding logo if available and company has no logo
+                            # Queue branding logo if available and company has no logo
                             branding = doc.get("branding")
                             if (
                                 branding
                                 and self._logo_processor
-                                and not self._logo_processor.company_has_logo(company_id)
+                                and company_id not in companies_with_logos
                             ):
-                                self._logo_processor.process_branding_logo(
-                                    company_id,
-                                    branding,
-                                )
+                                pending_logos.append((company_id, branding))
+                                companies_with_logos.add(company_id)
 
                             tracker.record_success()
                         else:
@@ -147,6 +154,10 @@ class BatchSnapshotManager:
                                 }
                             )
 
+                    # Download the batch's logos concurrently once snapshots are stored
+                    if pending_logos and self._logo_processor:
+                        self._logo_processor.process_branding_logos_bulk(pending_logos)
+
                     # Record failures for URLs that Firecrawl silently dropped
                     for batch_url in batch_urls:
                         if batch_url not in returned_urls:
@@ -15,6 +15,12 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Prepared-statement cache per connection. The repositories, analyzers and
+# dashboard queries issue a few hundred distinct statements, more than
+# sqlite3's default of 128; once the LRU overflows, cycling through them
+# re-parses every statement.
+_STATEMENT_CACHE_SIZE = 512
+
 
 class Database:
     """SQLite database service with schema management."""
@@ -38,7 +44,9 @@ class Database:
         """Get or create database connection."""
         if self._connection is None:
             self._connection = sqlite3.connect(
-                self.db_path, check_same_thread=self._check_same_thread
+                self.db_path,
+                check_same_thread=self._check_same_thread,
+                cached_statements=_STATEMENT_CACHE_SIZE,
             )
             self._connection.row_factory = sqlite3.Row
             self._connection.execute("PRAGMA journal_mode=WAL")
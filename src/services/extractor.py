@@ -78,6 +78,7 @@ class CompanyExtractor:
         stored = 0
         skipped = 0
         errors = 0
+        pending: list[tuple[str, str | None]] = []
 
         for record in records:
             processed += 1
@@ -118,23 +119,33 @@ class CompanyExtractor:
                 skipped += 1
                 continue
 
-            company_name = normalize_company_name(company_name)
-            homepage_url = fields.get("url")
-
-            try:
-                self.company_repo.upsert_company(
-                    name=company_name,
-                    homepage_url=homepage_url,
-                    source_sheet="Online Presence",
-                )
-                stored += 1
-            except Exception as exc:
-                logger.error(
-                    "failed_to_store_company",
-                    company=company_name,
-                    error=str(exc),
-                )
-                errors += 1
+            pending.append((normalize_company_name(company_name), fields.get("url")))
+
+        # Store all homepage records in one transaction; if the batch fails,
+        # retry row by row so one bad record only costs itself.
+        try:
+            stored = self.company_repo.upsert_companies(pending, source_sheet="Online Presence")
+        except Exception as exc:
+            logger.warning(
+                "batch_store_companies_failed",
+                count=len(pending),
+                error=str(exc),
+            )
+            for company_name, homepage_url in pending:
+                try:
+                    self.company_repo.upsert_company(
+                        name=company_name,
+                        homepage_url=homepage_url,
+                        source_sheet="Online Presence",
+                    )
+                    stored += 1
+                except Exception as row_exc:
+                    logger.error(
+                        "failed_to_store_company",
+                        company=company_name,
+                        error=str(row_exc),
+                    )
+                    errors += 1
 
         summary = {
             "processed": processed,
@@ -7,6 +7,8 @@ from typing import Any
 import structlog
 from firecrawl import Firecrawl
 
+from src.core.branding import to_branding
+
 logger = structlog.get_logger(__name__)
 
 # CRITICAL INVARIANT: only_main_content must ALWAYS be False.
@@ -62,7 +64,7 @@ class FirecrawlClient:
             # result is a Document object with Pydantic metadata
             metadata = getattr(result, "metadata", None)
             status_code = _get_metadata_field(metadata, "status_code", "statusCode")
-            branding = getattr(result, "branding", None)
+            branding = to_branding(getattr(result, "branding", None))
 
             return {
                 "success": True,
@@ -125,7 +127,7 @@ class FirecrawlClient:
                 for doc in result.data:
                     doc_metadata = getattr(doc, "metadata", None)
                     source_url = _get_metadata_field(doc_metadata, "source_url", "sourceURL") or ""
-                    doc_branding = getattr(doc, "branding", None)
+                    doc_branding = to_branding(getattr(doc, "branding", None))
                     documents.append(
                         {
                             "markdown": getattr(doc, "markdown", None) or "",
@@ -185,7 +187,7 @@ class FirecrawlClient:
                 for page in result.data:
                     page_metadata = getattr(page, "metadata", None)
                     source_url = _get_metadata_field(page_metadata, "source_url", "sourceURL") or ""
-                    page_branding = getattr(page, "branding", None)
+                    page_branding = to_branding(getattr(page, "branding", None))
                     pages.append(
                         {
                             "markdown": getattr(page, "markdown", None) or "",
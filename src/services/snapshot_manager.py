@@ -1,7 +1,10 @@
-"""Sequential snapshot capture manager."""
+"""Per-URL snapshot capture manager."""
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -11,6 +14,8 @@ from src.domains.monitoring.services.baseline_analyzer import BaselineAnalyzer
 from src.utils.progress import ProgressTracker
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.domains.discovery.services.branding_logo_processor import BrandingLogoProcessor
     from src.domains.monitoring.repositories.snapshot_repository import SnapshotRepository
     from src.repositories.company_repository import CompanyRepository
@@ -20,7 +25,7 @@ logger = structlog.get_logger(__name__)
 
 
 class SnapshotManager:
-    """Manages sequential snapshot capture for all companies."""
+    """Manages per-URL (non-batch) snapshot capture for all companies."""
 
     def __init__(
         self,
@@ -88,11 +93,14 @@ class SnapshotManager:
     def capture_all_snapshots(
         self,
         exclude_company_ids: set[int] | None = None,
+        max_workers: int = 1,
     ) -> dict[str, Any]:
         """Capture snapshots for all companies with homepage URLs.
 
         Args:
             exclude_company_ids: Company IDs to skip.
+            max_workers: Concurrent Firecrawl scrapes. Results are always
+                stored on the calling thread.
 
         Returns summary stats dict with report_details for report generation.
         """
@@ -111,64 +119,56 @@ class SnapshotManager:
         failed_details: list[dict[str, Any]] = []
         skipped_details: list[dict[str, Any]] = []
 
+        capturable: list[dict[str, Any]] = []
         for company in companies:
-            company_id = company["id"]
-            url = company["homepage_url"]
-
-            if not url:
-                tracker.record_skip()
-                skipped_details.append(
-                    {
-                        "company_id": company_id,
-                        "name": company.get("name", ""),
-                        "reason": "no_homepage_url",
-                    }
-                )
+            if company["homepage_url"]:
+                capturable.append(company)
                 continue
+            tracker.record_skip()
+            skipped_details.append(
+                {
+                    "company_id": company["id"],
+                    "name": company.get("name", ""),
+                    "reason": "no_homepage_url",
+                }
+            )
 
-            try:
-                result = self.firecrawl.capture_snapshot(url)
-                snapshot_data = prepare_snapshot_data(company_id, url, result)
-                snapshot_id = self.snapshot_repo.store_snapshot(snapshot_data)
-
-                # Auto-run baseline on first scrape for this company
-                if self.snapshot_repo.count_snapshots_for_company(company_id) == 1:
-                    self._baseline_analyzer.analyze_baseline_for_snapshot(snapshot_id)
-
-                # Process branding logo if available and company has no logo
-                branding = result.get("branding")
-                if (
-                    branding
-                    and self._logo_processor
-                    and not self._logo_processor.company_has_logo(company_id)
-                ):
-                    self._logo_processor.process_branding_logo(company_id, branding)
-
-                tracker.record_success()
-            except Exception as exc:
-                logger.error(
-                    "snapshot_capture_failed",
-                    company_id=company_id,
-                    url=url,
-                    error=str(exc),
-                )
-                tracker.record_failure(f"Company {company_id}: {exc}")
-                failed_details.append(
-                    {
-                        "company_id": company_id,
-                        "name": company.get("name", ""),
-                        "homepage_url": url,
-                        "error": str(exc),
-                    }
-                )
-                self.company_repo.store_processing_error(
-                    entity_type="snapshot",
-                    entity_id=company_id,
-                    error_type=type(exc).__name__,
-                    error_message=str(exc),
-                )
-
-            tracker.log_progress(every_n=10)
+        # One lookup for the whole run instead of one per captured company
+        companies_with_logos: set[int] = (
+            self._logo_processor.company_ids_with_logos(c["id"] for c in capturable)
+            if self._logo_processor
+            else set()
+        )
+        store = partial(
+            self._store_capture,
+            tracker=tracker,
+            failed_details=failed_details,
+            companies_with_logos=companies_with_logos,
+        )
+
+        if max_workers <= 1:
+            for company in capturable:
+                store(company, partial(self.firecrawl.capture_snapshot, company["homepage_url"]))
+        else:
+            # Scrapes overlap on worker threads; each result is stored here as it
+            # completes, since the SQLite connection belongs to this thread. At
+            # most 2 * max_workers scrapes are in flight and each future is
+            # dropped once stored, so payloads held in memory track the worker
+            # count rather than the number of companies.
+            capture = self.firecrawl.capture_snapshot
+            queued = iter(capturable)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                running: dict[Future[dict[str, Any]], dict[str, Any]] = {
+                    executor.submit(capture, company["homepage_url"]): company
+                    for company in islice(queued, 2 * max_workers)
+                }
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    while done:
+                        future = done.pop()
+                        store(running.pop(future), future.result)
+                        for company in islice(queued, 1):
+                            running[executor.submit(capture, company["homepage_url"])] = company
 
         summary = tracker.summary()
         summary["report_details"] = {
@@ -176,3 +176,55 @@ class SnapshotManager:
             "skipped": skipped_details,
         }
         return summary
+
+    def _store_capture(
+        self,
+        company: dict[str, Any],
+        fetch: Callable[[], dict[str, Any]],
+        tracker: ProgressTracker,
+        failed_details: list[dict[str, Any]],
+        companies_with_logos: set[int],
+    ) -> None:
+        """Fetch one company's scrape result, store it and record the outcome."""
+        company_id = company["id"]
+        url = company["homepage_url"]
+        try:
+            result = fetch()
+            snapshot_data = prepare_snapshot_data(company_id, url, result)
+            snapshot_id = self.snapshot_repo.store_snapshot(snapshot_data)
+
+            # Auto-run baseline on first scrape for this company
+            if self.snapshot_repo.count_snapshots_for_company(company_id) == 1:
+                self._baseline_analyzer.analyze_baseline_for_snapshot(snapshot_id)
+
+            # Process branding logo if available and company has no logo
+            branding = result.get("branding")
+            if branding and self._logo_processor and company_id not in companies_with_logos:
+                self._logo_processor.process_branding_logo(company_id, branding)
+                companies_with_logos.add(company_id)
+
+            tracker.record_success()
+        except Exception as exc:
+            logger.error(
+                "snapshot_capture_failed",
+                company_id=company_id,
+                url=url,
+                error=str(exc),
+            )
+            tracker.record_failure(f"Company {company_id}: {exc}")
+            failed_details.append(
+                {
+                    "company_id": company_id,
+                    "name": company.get("name", ""),
+                    "homepage_url": url,
+                    "error": str(exc),
+                }
+            )
+            self.company_repo.store_processing_error(
+                entity_type="snapshot",
+                entity_id=company_id,
+                error_type=type(exc).__name__,
+                error_message=str(exc),
+            )
+
+        tracker.log_progress(every_n=10)
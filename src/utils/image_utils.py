@@ -4,10 +4,34 @@ from __future__ import annotations
 
 import base64
 import io
+from typing import TYPE_CHECKING
 
 import imagehash
+import numpy as np
+import scipy.fft  # type: ignore[import-untyped]
 from PIL import Image
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# pHash geometry, matching imagehash.phash defaults (hash_size=8,
+# highfreq_factor=4): images are reduced to 32x32 grayscale and the top-left
+# 8x8 block of the 2-D DCT-II is thresholded against its median.
+_PHASH_SIZE = 8
+_PHASH_IMAGE_SIZE = _PHASH_SIZE * 4
+
+# Leading signatures of the raster formats logos are served in.
+_MAGIC_PREFIXES: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+    (b"\x00\x00\x01\x00", "ICO"),
+    (b"BM", "BMP"),
+    (b"II*\x00", "TIFF"),
+    (b"MM\x00*", "TIFF"),
+)
+
 
 def decode_base64_image(data: str) -> Image.Image:
     """Decode a base64-encoded image string to a PIL Image."""
@@ -27,16 +51,39 @@ def compute_perceptual_hash(image: Image.Image) -> str:
     return str(imagehash.phash(image))
 
 
+def compute_perceptual_hashes(images: Sequence[Image.Image]) -> list[str]:
+    """Compute pHashes for many images with a single vectorized DCT.
+
+    Produces exactly the hex strings compute_perceptual_hash() would for each
+    image, so results can be stored and compared interchangeably.
+    """
+    if not images:
+        return []
+    size = (_PHASH_IMAGE_SIZE, _PHASH_IMAGE_SIZE)
+    pixels = np.stack(
+        [np.asarray(img.convert("L").resize(size, Image.Resampling.LANCZOS)) for img in images]
+    )
+    # Unnormalized DCT-II over both image axes, as imagehash applies it.
+    dct = scipy.fft.dctn(pixels.astype(np.float64), type=2, axes=(-2, -1))
+    low = dct[:, :_PHASH_SIZE, :_PHASH_SIZE].reshape(len(images), -1)
+    bits = low > np.median(low, axis=1, keepdims=True)
+    return [row.tobytes().hex() for row in np.packbits(bits, axis=1)]
+
+
 def compute_hash_similarity(hash1: str, hash2: str) -> float:
     """Compute similarity between two perceptual hashes.
 
     Returns a float between 0.0 (completely different) and 1.0 (identical).
     """
-    h1 = imagehash.hex_to_hash(hash1)
-    h2 = imagehash.hex_to_hash(hash2)
-    max_distance = len(h1.hash.flatten())
-    hamming_distance = h1 - h2
-    return 1.0 - (hamming_distance / max_distance)
+    return 1.0 - (hamming_distance(hash1, hash2) / (len(hash1) * 4))
+
+
+def hamming_distance(hash1: str, hash2: str) -> int:
+    """Count the differing bits between two equal-length hex perceptual hashes."""
+    if len(hash1) != len(hash2):
+        msg = f"Perceptual hashes differ in length: {len(hash1)} vs {len(hash2)}"
+        raise TypeError(msg)
+    return (int(hash1, 16) ^ int(hash2, 16)).bit_count()
 
 
 def resize_image(image: Image.Image, max_width: int = 256, max_height: int = 256) -> Image.Image:
@@ -61,6 +108,30 @@ def is_valid_logo_size(image: Image.Image, min_size: int = 16, max_size: int = 2
     return min_size <= width <= max_size and min_size <= height <= max_size
 
 
+def sniff_image_format(data: bytes) -> str | None:
+    """Identify a raster image format from its leading bytes.
+
+    Common logo formats are matched on their signature; anything else is
+    left to Pillow's format detection, which reads only the header. Returns
+    the format name, or None when no decoder recognizes the bytes (HTML
+    error pages, SVG, truncated bodies).
+    """
+    for prefix, name in _MAGIC_PREFIXES:
+        if data.startswith(prefix):
+            return name
+    # RIFF container (WEBP) and ISO base media (AVIF) carry their tag at offset 8/4
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "WEBP"
+    if data[4:12] in (b"ftypavif", b"ftypavis"):
+        return "AVIF"
+    # Less common formats (CUR, other ISO-BMFF brands, ...): ask Pillow
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return image.format
+    except Exception:
+        return None
+
+
 def image_from_bytes(data: bytes) -> Image.Image:
     """Create a PIL Image from raw bytes."""
     return Image.open(io.BytesIO(data))
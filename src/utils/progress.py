@@ -10,9 +10,12 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressTracker:
-    """Track progress of batch operations."""
+    """Track progress of batch operations.
+
+    Slotted: the counters are bumped once per item in every batch loop.
+    """
 
     total: int
     processed: int = 0
@@ -10,6 +10,7 @@ import pytest
 from src.services.database import Database
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
 
@@ -19,11 +20,27 @@ def tmp_db_path(tmp_path: Path) -> str:
     return str(tmp_path / "test.db")
 
 
+@pytest.fixture(scope="session")
+def schema_template() -> Generator[Database, None, None]:
+    """Build the full schema once per session in an in-memory database.
+
+    Per-test databases are cloned from this template with the SQLite backup
+    API, which is far cheaper than replaying every CREATE/ALTER statement.
+    Repositories commit on every write, so a shared connection wrapped in
+    BEGIN/ROLLBACK would not isolate tests; a fresh file per test does.
+    """
+    template = Database(db_path=":memory:")
+    template.init_db()
+    yield template
+    template.close()
+
+
 @pytest.fixture
-def db(tmp_db_path: str) -> Database:
+def db(tmp_db_path: str, schema_template: Database) -> Database:
     """Provide an initialized temporary database."""
     database = Database(db_path=tmp_db_path)
-    database.init_db()
+    schema_template.connection.backup(database.connection)
+    database.execute("PRAGMA synchronous=OFF")
     return database
 
 
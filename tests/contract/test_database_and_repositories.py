@@ -525,6 +525,48 @@ class TestCompanyRepositoryUpsert:
         assert company is not None
         assert company["source_sheet"] == "Sheet2"
 
+    def test_upsert_companies_inserts_and_updates_in_one_batch(self, db: Database) -> None:
+        repo = CompanyRepository(db, "test-user")
+        existing_id = repo.upsert_company("Existing Corp", "https://existing.com", "Sheet1")
+        null_id = repo.upsert_company("Null URL Corp", None, "Sheet1")
+
+        count = repo.upsert_companies(
+            [
+                ("Existing Corp", "https://existing.com"),
+                ("Null URL Corp", None),
+                ("New Corp", "https://new.com"),
+                ("New Corp", "https://new.com"),
+            ],
+            "Sheet2",
+        )
+
+        assert count == 4
+        companies = repo.get_all_companies()
+        assert len(companies) == 3
+        assert {c["source_sheet"] for c in companies} == {"Sheet2"}
+        assert {c["id"] for c in companies} >= {existing_id, null_id}
+
+    def test_upsert_companies_updates_only_first_null_url_duplicate(self, db: Database) -> None:
+        repo = CompanyRepository(db, "test-user")
+        now = datetime.now(UTC).isoformat()
+        for _ in range(2):
+            db.execute(
+                """INSERT INTO companies (name, homepage_url, source_sheet,
+                   flagged_for_review, created_at, updated_at)
+                   VALUES ('Dup Corp', NULL, 'Sheet1', 0, ?, ?)""",
+                (now, now),
+            )
+        db.connection.commit()
+
+        repo.upsert_companies([("Dup Corp", None)], "Sheet2")
+
+        rows = db.fetchall("SELECT source_sheet FROM companies WHERE name = 'Dup Corp' ORDER BY id")
+        assert [row["source_sheet"] for row in rows] == ["Sheet2", "Sheet1"]
+
+    def test_upsert_companies_empty(self, db: Database) -> None:
+        repo = CompanyRepository(db, "test-user")
+        assert repo.upsert_companies([], "Sheet1") == 0
+
 
 class TestCompanyRepositoryGet:
     """Test retrieval methods."""
@@ -774,6 +816,28 @@ class TestSnapshotRepositoryLatest:
         latest = repo.get_latest_snapshots(company_id, limit=3)
         assert len(latest) == 3
 
+    def test_recent_snapshot_history_is_narrow_and_newest_first(
+        self, db_with_company: DbWithCompany
+    ) -> None:
+        db, company_id = db_with_company
+        repo = SnapshotRepository(db, "test-user")
+
+        for i in range(4):
+            repo.store_snapshot(
+                {
+                    "company_id": company_id,
+                    "url": "https://testcorp.com",
+                    "content_markdown": f"# Page {i}",
+                    "captured_at": _past_iso(i),
+                    "content_checksum": f"check{i}",
+                }
+            )
+
+        history = repo.get_recent_snapshot_history(company_id, limit=3)
+        assert len(history) == 3
+        assert history[0]["captured_at"] > history[1]["captured_at"] > history[2]["captured_at"]
+        assert set(history[0]) == {"id", "captured_at", "error_message", "baseline_sentiment"}
+
     def test_get_snapshots_for_company_ordered_asc(self, db_with_company: DbWithCompany) -> None:
         db, company_id = db_with_company
         repo = SnapshotRepository(db, "test-user")
@@ -1737,6 +1801,51 @@ class TestSocialMediaLinkBlogAndLogo:
         cid = _insert_company(db)
         assert repo.get_company_logo(cid) is None
 
+    def test_get_company_ids_with_logos_filters_to_requested_ids(
+        self, db_with_company: DbWithCompany
+    ) -> None:
+        db, company_id = db_with_company
+        repo = SocialMediaLinkRepository(db, "test-user")
+        other_with_logo = _insert_company(db, "Logo Corp", "https://logo.com")
+        without_logo = _insert_company(db, "Bare Corp", "https://bare.com")
+        for cid in (company_id, other_with_logo):
+            repo.store_company_logo(
+                {
+                    "company_id": cid,
+                    "image_data": b"logo",
+                    "image_format": "png",
+                    "perceptual_hash": f"hash_{cid}",
+                    "source_url": "https://example.com/logo.png",
+                    "extraction_location": "header",
+                    "extracted_at": _now_iso(),
+                }
+            )
+
+        assert repo.get_company_ids_with_logos() == {company_id, other_with_logo}
+        assert repo.get_company_ids_with_logos([company_id, without_logo, company_id]) == {
+            company_id
+        }
+        assert repo.get_company_ids_with_logos([]) == set()
+
+    def test_get_latest_logo_extraction_times(self, db_with_company: DbWithCompany) -> None:
+        db, company_id = db_with_company
+        repo = SocialMediaLinkRepository(db, "test-user")
+        _insert_company(db, "Bare Corp", "https://bare.com")
+        for extracted_at in ("2024-01-01T00:00:00+00:00", "2025-06-01T00:00:00+00:00"):
+            repo.store_company_logo(
+                {
+                    "company_id": company_id,
+                    "image_data": b"logo",
+                    "image_format": "png",
+                    "perceptual_hash": f"hash_{extracted_at}",
+                    "source_url": "https://example.com/logo.png",
+                    "extraction_location": "header",
+                    "extracted_at": extracted_at,
+                }
+            )
+
+        assert repo.get_latest_logo_extraction_times() == {company_id: "2025-06-01T00:00:00+00:00"}
+
 
 # ===========================================================================
 # Section 7: NewsArticleRepository tests
@@ -111,6 +111,38 @@ class TestLeadershipRepository:
         # Should return 0 (no new row) or succeed without error
         assert isinstance(second_id, int)
 
+    def test_duplicate_returns_zero(
+        self,
+        leadership_repo: LeadershipRepository,
+        sample_leadership_data: dict[str, Any],
+    ) -> None:
+        """A URL variant of an existing leader is skipped and returns 0."""
+        leadership_repo.store_leadership(sample_leadership_data)
+        variant = {
+            **sample_leadership_data,
+            "linkedin_profile_url": "https://linkedin.com/in/alice-smith/",
+        }
+        assert leadership_repo.store_leadership(variant) == 0
+
+    def test_store_leadership_many_counts_new_rows(
+        self,
+        leadership_repo: LeadershipRepository,
+        sample_leadership_data: dict[str, Any],
+        sample_company: dict[str, Any],
+    ) -> None:
+        leadership_repo.store_leadership(sample_leadership_data)
+        cto = {
+            **sample_leadership_data,
+            "person_name": "Bob Jones",
+            "title": "CTO",
+            "linkedin_profile_url": "https://www.linkedin.com/in/bob-jones",
+        }
+        inserted = leadership_repo.store_leadership_many([sample_leadership_data, cto, cto])
+        assert inserted == 1
+        results = leadership_repo.get_leadership_for_company(sample_company["id"])
+        assert sorted(r["person_name"] for r in results) == ["Alice Smith", "Bob Jones"]
+        assert leadership_repo.store_leadership_many([]) == 0
+
     def test_leadership_exists(
         self,
         leadership_repo: LeadershipRepository,
@@ -146,6 +178,28 @@ class TestLeadershipRepository:
         assert len(all_records) == 1
         assert all_records[0]["is_current"] == 0
 
+    def test_mark_not_current_many(
+        self,
+        leadership_repo: LeadershipRepository,
+        sample_leadership_data: dict[str, Any],
+        sample_company: dict[str, Any],
+    ) -> None:
+        cto = {
+            **sample_leadership_data,
+            "person_name": "Bob Jones",
+            "title": "CTO",
+            "linkedin_profile_url": "https://www.linkedin.com/in/bob-jones",
+        }
+        leadership_repo.store_leadership_many([sample_leadership_data, cto])
+        updated = leadership_repo.mark_not_current_many(
+            sample_company["id"],
+            ["https://www.linkedin.com/in/alice-smith", "https://www.linkedin.com/in/nobody"],
+        )
+        assert updated == 1
+        current = leadership_repo.get_current_leadership(sample_company["id"])
+        assert [r["person_name"] for r in current] == ["Bob Jones"]
+        assert leadership_repo.mark_not_current_many(sample_company["id"], []) == 0
+
     def test_get_all_leadership(
         self,
         leadership_repo: LeadershipRepository,
@@ -6,14 +6,23 @@ Mock the API clients, use real Database for data persistence verification.
 from __future__ import annotations
 
 import hashlib
+import sqlite3
+import weakref
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from io import BytesIO
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bs4 import BeautifulSoup
+from PIL import Image
 
 from src.domains.discovery.repositories.social_media_link_repository import (
     SocialMediaLinkRepository,
 )
 from src.domains.discovery.services.account_classifier import AccountClassifier
+from src.domains.discovery.services.branding_logo_processor import BrandingLogoProcessor
 from src.domains.discovery.services.logo_service import LogoService
 from src.domains.discovery.services.social_media_discovery import SocialMediaDiscovery
 from src.domains.monitoring.repositories.change_record_repository import (
@@ -36,8 +45,15 @@ from src.repositories.company_repository import CompanyRepository
 from src.services.batch_snapshot_manager import BatchSnapshotManager
 from src.services.extractor import CompanyExtractor
 from src.services.snapshot_manager import SnapshotManager
+from src.utils.image_utils import (
+    compute_perceptual_hash,
+    encode_image_to_base64,
+    image_from_bytes,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from src.services.database import Database
 
 
@@ -46,6 +62,20 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
+def _make_png(size: tuple[int, int] = (64, 64), color: str = "red") -> bytes:
+    """Render a solid-color PNG and return its encoded bytes."""
+    img = Image.new("RGB", size, color=color)
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# Encoded once at import; each branding test group keeps its own distinct payload.
+_PNG_64 = _make_png()
+_PNG_64_BLUE = _make_png(color="blue")
+_PNG_64_GREEN = _make_png(color="green")
+
+
 def _insert_company(db: Database, name: str, homepage_url: str | None) -> int:
     """Insert a company and return its ID."""
     now = datetime.now(UTC).isoformat()
@@ -123,6 +153,12 @@ def _insert_change_record(
     return cursor.lastrowid or 0
 
 
+@pytest.fixture
+def alpha_id(db: Database) -> int:
+    """Insert the "Alpha Inc" company most tests start from and return its ID."""
+    return _insert_company(db, "Alpha Inc", "https://alpha.com")
+
+
 # ===========================================================================
 # 1. SnapshotManager
 # ===========================================================================
@@ -164,9 +200,70 @@ class TestSnapshotManager:
         assert len(snaps_alpha) == 1
         assert len(snaps_beta) == 1
 
-    def test_records_failures(self, db: Database) -> None:
+    def test_parallel_capture_stores_every_company(self, db: Database) -> None:
+        """With max_workers > 1, scrapes run on workers and every result is stored."""
+        ids = [_insert_company(db, f"Co{i}", f"https://co{i}.com") for i in range(5)]
+
+        def capture(url: str) -> dict[str, Any]:
+            if url == "https://co3.com":
+                raise ConnectionError("timeout")
+            return {"success": True, "markdown": f"# {url}", "html": "", "statusCode": 200}
+
+        mock_firecrawl = MagicMock()
+        mock_firecrawl.capture_snapshot.side_effect = capture
+
+        snapshot_repo = SnapshotRepository(db, "test-user")
+        company_repo = CompanyRepository(db, "test-user")
+        manager = SnapshotManager(mock_firecrawl, snapshot_repo, company_repo)
+
+        summary = manager.capture_all_snapshots(max_workers=4)
+
+        assert summary["successful"] == 4
+        assert summary["failed"] == 1
+        assert summary["report_details"]["failed"][0]["company_id"] == ids[3]
+        for i, company_id in enumerate(ids):
+            snaps = snapshot_repo.get_latest_snapshots(company_id, limit=1)
+            assert len(snaps) == (0 if i == 3 else 1)
+
+    def test_parallel_capture_releases_stored_results(self, db: Database) -> None:
+        """Scrape results are freed once stored, so memory tracks workers, not companies."""
+        for i in range(30):
+            _insert_company(db, f"Co{i}", f"https://co{i}.com")
+
+        class _Payload(dict[str, Any]):
+            """Scrape result that can be weakly referenced."""
+
+        payloads: list[weakref.ref[_Payload]] = []
+
+        def capture(url: str) -> _Payload:
+            payload = _Payload(success=True, markdown=f"# {url}", html="", statusCode=200)
+            payloads.append(weakref.ref(payload))
+            return payload
+
+        mock_firecrawl = MagicMock()
+        mock_firecrawl.capture_snapshot.side_effect = capture
+
+        snapshot_repo = SnapshotRepository(db, "test-user")
+        company_repo = CompanyRepository(db, "test-user")
+        manager = SnapshotManager(mock_firecrawl, snapshot_repo, company_repo)
+
+        store_capture = manager._store_capture
+        live_after_store: list[int] = []
+
+        def counting_store(*args: Any, **kwargs: Any) -> None:
+            store_capture(*args, **kwargs)
+            live_after_store.append(sum(ref() is not None for ref in payloads))
+
+        with patch.object(manager, "_store_capture", new=counting_store):
+            summary = manager.capture_all_snapshots(max_workers=2)
+
+        assert summary["successful"] == 30
+        assert len(live_after_store) == 30
+        # The scrape window (2 * max_workers) plus the result just stored
+        assert max(live_after_store) <= 2 * 2 + 1
+
+    def test_records_failures(self, db: Database, alpha_id: int) -> None:
         """Failed captures are recorded without aborting the batch."""
-        _insert_company(db, "Alpha Inc", "https://alpha.com")
         _insert_company(db, "Beta Inc", "https://beta.com")
 
         mock_firecrawl = MagicMock()
@@ -194,9 +291,8 @@ class TestSnapshotManager:
         assert summary["failed"] == 1
         assert len(summary["errors"]) == 1
 
-    def test_skips_companies_without_urls(self, db: Database) -> None:
+    def test_skips_companies_without_urls(self, db: Database, alpha_id: int) -> None:
         """Companies without homepage_url are filtered out."""
-        _insert_company(db, "Alpha Inc", "https://alpha.com")
         _insert_company(db, "No URL Corp", None)
 
         mock_firecrawl = MagicMock()
@@ -221,9 +317,8 @@ class TestSnapshotManager:
         assert mock_firecrawl.capture_snapshot.call_count == 1
         assert summary["successful"] == 1
 
-    def test_captures_single_company_snapshot(self, db: Database) -> None:
+    def test_captures_single_company_snapshot(self, db: Database, alpha_id: int) -> None:
         """capture_snapshot_for_company captures a snapshot for one company."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         _insert_company(db, "Beta Inc", "https://beta.com")
 
         mock_firecrawl = MagicMock()
@@ -242,14 +337,14 @@ class TestSnapshotManager:
         company_repo = CompanyRepository(db, "test-user")
         manager = SnapshotManager(mock_firecrawl, snapshot_repo, company_repo)
 
-        summary = manager.capture_snapshot_for_company(cid)
+        summary = manager.capture_snapshot_for_company(alpha_id)
 
         assert summary["successful"] == 1
         assert summary["failed"] == 0
         assert mock_firecrawl.capture_snapshot.call_count == 1
         mock_firecrawl.capture_snapshot.assert_called_once_with("https://alpha.com")
 
-        snaps = snapshot_repo.get_latest_snapshots(cid, limit=1)
+        snaps = snapshot_repo.get_latest_snapshots(alpha_id, limit=1)
         assert len(snaps) == 1
 
     def test_single_company_not_found_raises(self, db: Database) -> None:
@@ -278,10 +373,8 @@ class TestSnapshotManager:
         with pytest.raises(ValueError, match="no homepage URL"):
             manager.capture_snapshot_for_company(cid)
 
-    def test_single_company_failure_recorded(self, db: Database) -> None:
+    def test_single_company_failure_recorded(self, db: Database, alpha_id: int) -> None:
         """capture_snapshot_for_company records failures in summary."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
-
         mock_firecrawl = MagicMock()
         mock_firecrawl.capture_snapshot.side_effect = ConnectionError("timeout")
 
@@ -289,7 +382,7 @@ class TestSnapshotManager:
         company_repo = CompanyRepository(db, "test-user")
         manager = SnapshotManager(mock_firecrawl, snapshot_repo, company_repo)
 
-        summary = manager.capture_snapshot_for_company(cid)
+        summary = manager.capture_snapshot_for_company(alpha_id)
 
         assert summary["successful"] == 0
         assert summary["failed"] == 1
@@ -344,9 +437,8 @@ class TestBatchSnapshotManager:
         assert len(snapshot_repo.get_latest_snapshots(cid1, limit=1)) == 1
         assert len(snapshot_repo.get_latest_snapshots(cid2, limit=1)) == 1
 
-    def test_handles_batch_failure(self, db: Database) -> None:
+    def test_handles_batch_failure(self, db: Database, alpha_id: int) -> None:
         """Batch API failure marks all URLs as failed."""
-        _insert_company(db, "Alpha Inc", "https://alpha.com")
         _insert_company(db, "Beta Inc", "https://beta.com")
 
         mock_firecrawl = MagicMock()
@@ -368,10 +460,8 @@ class TestBatchSnapshotManager:
         assert summary["failed"] == 2
         assert summary["successful"] == 0
 
-    def test_url_to_company_matching(self, db: Database) -> None:
+    def test_url_to_company_matching(self, db: Database, alpha_id: int) -> None:
         """Documents matched to companies via URL prefix matching."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
-
         mock_firecrawl = MagicMock()
         mock_firecrawl.batch_capture_snapshots.return_value = {
             "success": True,
@@ -396,7 +486,7 @@ class TestBatchSnapshotManager:
         summary = manager.capture_batch_snapshots(batch_size=10)
 
         assert summary["successful"] == 1
-        assert len(snapshot_repo.get_latest_snapshots(cid, limit=1)) == 1
+        assert len(snapshot_repo.get_latest_snapshots(alpha_id, limit=1)) == 1
 
 
 # ===========================================================================
@@ -446,6 +536,50 @@ class TestCompanyExtractor:
         assert "Alpha Inc" in names
         assert "Beta Inc" in names
 
+    def test_batch_failure_falls_back_to_per_record_errors(self, db: Database) -> None:
+        """When the batch upsert fails, records are stored one by one and errors counted each."""
+        mock_airtable = MagicMock()
+        mock_airtable.fetch_online_presence_records.return_value = [
+            {
+                "id": f"rec{i}",
+                "fields": {
+                    "resources": ["homepage"],
+                    "company_name": [f"rec{name}"],
+                    "url": f"https://{name.lower()}.com",
+                },
+            }
+            for i, name in enumerate(("Alpha", "Beta", "Gamma"))
+        ]
+        mock_airtable.build_company_name_lookup.return_value = {
+            "recAlpha": "Alpha Inc",
+            "recBeta": "Beta Inc",
+            "recGamma": "Gamma Inc",
+        }
+
+        company_repo = CompanyRepository(db, "test-user")
+        extractor = CompanyExtractor(mock_airtable, company_repo)
+        upsert_company = company_repo.upsert_company
+
+        def failing_upsert(name: str, homepage_url: str | None, source_sheet: str) -> int:
+            if name == "Beta Inc":
+                raise sqlite3.IntegrityError("constraint failed")
+            return upsert_company(name, homepage_url, source_sheet)
+
+        with (
+            patch.object(
+                company_repo,
+                "upsert_companies",
+                side_effect=sqlite3.IntegrityError("constraint failed"),
+            ),
+            patch.object(company_repo, "upsert_company", side_effect=failing_upsert),
+        ):
+            summary = extractor.extract_companies()
+
+        assert summary["stored"] == 2
+        assert summary["errors"] == 1
+        names = {c["name"] for c in company_repo.get_all_companies()}
+        assert names == {"Alpha Inc", "Gamma Inc"}
+
     def test_handles_missing_fields(self, db: Database) -> None:
         """Records with missing company_name are skipped."""
         mock_airtable = MagicMock()
@@ -528,18 +662,17 @@ class TestCompanyExtractor:
 class TestChangeDetector:
     """Contract tests for ChangeDetector using real DB."""
 
-    def test_detects_changes(self, db: Database) -> None:
+    def test_detects_changes(self, db: Database, alpha_id: int) -> None:
         """Differing checksums trigger significance analysis."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# Old content about layoffs and restructuring",
             captured_at="2025-01-01T00:00:00+00:00",
         )
         _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# New content about layoffs and downsizing",
             captured_at="2025-02-01T00:00:00+00:00",
         )
@@ -554,7 +687,7 @@ class TestChangeDetector:
         assert summary["changes_found"] >= 1
         assert summary["successful"] >= 1
 
-        changes = change_repo.get_changes_for_company(cid)
+        changes = change_repo.get_changes_for_company(alpha_id)
         assert len(changes) >= 1
         assert changes[0]["has_changed"] == 1
         assert changes[0]["significance_classification"] is not None
@@ -629,24 +762,23 @@ class TestChangeDetector:
 class TestSignificanceAnalyzer:
     """Contract tests for SignificanceAnalyzer backfill functionality."""
 
-    def test_backfills_significance(self, db: Database) -> None:
+    def test_backfills_significance(self, db: Database, alpha_id: int) -> None:
         """Records without significance get backfilled."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         snap_old_id = _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# Old content",
             captured_at="2025-01-01T00:00:00+00:00",
         )
         snap_new_id = _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# Company raised funding in a Series B round. Revenue growth is strong.",
             captured_at="2025-02-01T00:00:00+00:00",
         )
         record_id = _insert_change_record(
             db,
-            cid,
+            alpha_id,
             snap_old_id,
             snap_new_id,
             has_changed=True,
@@ -666,24 +798,23 @@ class TestSignificanceAnalyzer:
         assert row is not None
         assert row["significance_classification"] is not None
 
-    def test_dry_run_does_not_update(self, db: Database) -> None:
+    def test_dry_run_does_not_update(self, db: Database, alpha_id: int) -> None:
         """dry_run=True processes but does not write to DB."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         snap_old_id = _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# Old content",
             captured_at="2025-01-01T00:00:00+00:00",
         )
         snap_new_id = _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# New content about layoffs",
             captured_at="2025-02-01T00:00:00+00:00",
         )
         record_id = _insert_change_record(
             db,
-            cid,
+            alpha_id,
             snap_old_id,
             snap_new_id,
             has_changed=True,
@@ -915,6 +1046,95 @@ class TestBaselineAnalyzer:
         assert row is not None
         assert row["baseline_classification"] is None
 
+    def test_backfill_with_workers_stores_llm_results(self, db: Database) -> None:
+        """max_workers > 1 overlaps LLM calls and still stores every baseline."""
+        snap_ids = [
+            _insert_snapshot(
+                db,
+                _insert_company(db, f"Worker Co {i}", f"https://worker{i}.com"),
+                f"# Worker Co {i} page",
+                captured_at="2025-01-01T00:00:00+00:00",
+            )
+            for i in range(4)
+        ]
+
+        llm_client = MagicMock()
+        llm_client.classify_baseline.return_value = {
+            "classification": "significant",
+            "sentiment": "positive",
+            "confidence": 0.9,
+            "reasoning": "LLM verdict",
+        }
+
+        snapshot_repo = SnapshotRepository(db, "test-user")
+        from src.domains.monitoring.services.baseline_analyzer import BaselineAnalyzer
+
+        company_repo = CompanyRepository(db, "test-user")
+        analyzer = BaselineAnalyzer(
+            snapshot_repo, company_repo, llm_client=llm_client, llm_enabled=True
+        )
+        summary = analyzer.backfill_baselines(max_workers=3)
+
+        assert summary["successful"] == 4
+        assert llm_client.classify_baseline.call_count == 4
+        for snap_id in snap_ids:
+            row = db.fetchone("SELECT * FROM snapshots WHERE id = ?", (snap_id,))
+            assert row is not None
+            assert row["baseline_classification"] == "significant"
+            assert row["baseline_notes"] == "LLM verdict"
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_backfill_falls_back_to_next_snapshot_when_store_fails(
+        self, db: Database, max_workers: int
+    ) -> None:
+        """A company whose first candidate fails still gets a baseline from the next one."""
+        cid = _insert_company(db, "Retry Corp", "https://retry.com")
+        for page in ("# Retry Corp page", "# Retry Corp page, again"):
+            _insert_snapshot(db, cid, page, captured_at="2025-01-01T00:00:00+00:00")
+
+        llm_client = MagicMock()
+        llm_client.classify_baseline.return_value = {"classification": "insignificant"}
+
+        snapshot_repo = SnapshotRepository(db, "test-user")
+        from src.domains.monitoring.services.baseline_analyzer import BaselineAnalyzer
+
+        company_repo = CompanyRepository(db, "test-user")
+        analyzer = BaselineAnalyzer(
+            snapshot_repo, company_repo, llm_client=llm_client, llm_enabled=True
+        )
+        update_baseline = snapshot_repo.update_baseline
+        calls: list[int] = []
+
+        def fail_first(snapshot_id: int, data: dict[str, Any]) -> None:
+            calls.append(snapshot_id)
+            if len(calls) == 1:
+                raise RuntimeError("disk full")
+            update_baseline(snapshot_id, data)
+
+        with patch.object(snapshot_repo, "update_baseline", side_effect=fail_first):
+            summary = analyzer.backfill_baselines(max_workers=max_workers)
+
+        assert summary["failed"] == 1
+        assert summary["successful"] == 1
+        assert len(calls) == 2
+        assert snapshot_repo.has_baseline_for_company(cid)
+
+    def test_backfill_dry_run_classifies_every_candidate_snapshot(self, db: Database) -> None:
+        """Nothing is stored in a dry run, so each candidate snapshot is classified."""
+        cid = _insert_company(db, "Dry Pair Corp", "https://drypair.com")
+        for page in ("# Dry Pair page", "# Dry Pair page, again"):
+            _insert_snapshot(db, cid, page, captured_at="2025-01-01T00:00:00+00:00")
+
+        snapshot_repo = SnapshotRepository(db, "test-user")
+        from src.domains.monitoring.services.baseline_analyzer import BaselineAnalyzer
+
+        company_repo = CompanyRepository(db, "test-user")
+        analyzer = BaselineAnalyzer(snapshot_repo, company_repo)
+        summary = analyzer.backfill_baselines(dry_run=True)
+
+        assert summary["successful"] == 2
+        assert not snapshot_repo.has_baseline_for_company(cid)
+
 
 # ===========================================================================
 # 6. StatusAnalyzer
@@ -1222,6 +1442,30 @@ class TestStatusAnalyzerMultiSource:
         types = {i["type"] for i in indicators}
         assert "leadership_departure" not in types
 
+    def test_repeated_capture_errors_add_error_pattern_indicator(self, db: Database) -> None:
+        """Three failed captures among the last five snapshots flag an error pattern."""
+        current_year = datetime.now(UTC).year
+        cid = _insert_company(db, "Flaky Corp", "https://flaky.com")
+        for day in (1, 2, 3):
+            snapshot_id = _insert_snapshot(
+                db, cid, "", captured_at=f"{current_year - 1}-01-0{day}T00:00:00+00:00"
+            )
+            db.execute(
+                "UPDATE snapshots SET error_message = ? WHERE id = ?",
+                ("DNS resolution failed", snapshot_id),
+            )
+        db.connection.commit()
+        _insert_snapshot(db, cid, f"# Flaky Corp\n\nCopyright {current_year} Flaky Corp.")
+
+        analyzer = self._build_analyzer(db)
+        analyzer.analyze_all_statuses()
+
+        status = CompanyStatusRepository(db, "test-user").get_latest_status(cid)
+        assert status is not None
+        indicators = status.get("indicators") or []
+        types = {i["type"] for i in indicators}
+        assert "error_pattern" in types
+
     def test_positive_news_adds_positive_indicator(self, db: Database) -> None:
         """Significant-positive news contributes a positive signal."""
         current_year = datetime.now(UTC).year
@@ -1678,6 +1922,47 @@ class TestLogoService:
         assert result is not None
         assert result["source_url"] == "/apple-icon-180.png"
 
+    def test_favicon_only_page_skips_html_parser(self) -> None:
+        """Favicon-only pages are read from raw <link> tags, matching the parser path."""
+        service = LogoService()
+        html = (
+            "<html><head>"
+            "<link href='https://ycombinator.com/favicon.ico' rel='icon'>"
+            "<link href=/favicon.png?v=2&amp;s=32 REL=icon>"
+            "</head><body><p>Hello</p></body></html>"
+        )
+        with patch("bs4.BeautifulSoup") as mock_soup:
+            result = service.extract_logo_from_html(html, "https://example.com")
+
+        mock_soup.assert_not_called()
+        assert result == {"source_url": "/favicon.png?v=2&s=32", "extraction_location": "favicon"}
+
+    def test_favicon_fast_path_ignores_commented_and_script_links(self) -> None:
+        """Icon links inside comments or script text are skipped, as the parser skips them."""
+        service = LogoService()
+        html = (
+            "<html><head>"
+            "<!-- <link rel='apple-touch-icon' href='/old-touch.png'> -->"
+            "<script>document.write('<link rel=icon href=/js.ico>')</script>"
+            "<link rel=icon href=/favicon.ico>"
+            "</head><body><p>Hello</p></body></html>"
+        )
+        with patch("bs4.BeautifulSoup") as mock_soup:
+            result = service.extract_logo_from_html(html, "https://example.com")
+
+        mock_soup.assert_not_called()
+        assert result == {"source_url": "/favicon.ico", "extraction_location": "favicon"}
+
+    def test_favicon_fast_path_defers_unterminated_script_to_parser(self) -> None:
+        """An unterminated script block is left to the HTML parser to interpret."""
+        service = LogoService()
+        html = "<html><head><script>var a = 1;<link rel=icon href=/x.ico>"
+        with patch("bs4.BeautifulSoup", wraps=BeautifulSoup) as mock_soup:
+            result = service.extract_logo_from_html(html, "https://example.com")
+
+        mock_soup.assert_called_once()
+        assert result is None
+
     # -- Strategy 4: og:image (lowest priority) --
 
     def test_og_image_is_lowest_priority(self) -> None:
@@ -1739,10 +2024,8 @@ class TestLogoService:
 class TestNewsMonitorManager:
     """Contract tests for NewsMonitorManager with mocked KagiClient."""
 
-    def test_searches_verifies_and_stores_articles(self, db: Database) -> None:
+    def test_searches_verifies_and_stores_articles(self, db: Database, alpha_id: int) -> None:
         """Articles searched, verified, and stored in the database."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
-
         mock_kagi = MagicMock()
         mock_kagi.search.return_value = [
             {
@@ -1759,13 +2042,13 @@ class TestNewsMonitorManager:
         snapshot_repo = SnapshotRepository(db, "test-user")
         manager = NewsMonitorManager(mock_kagi, news_repo, company_repo, snapshot_repo)
 
-        result = manager.search_company_news(company_id=cid)
+        result = manager.search_company_news(company_id=alpha_id)
 
         assert result["articles_found"] == 1
         assert result["articles_verified"] >= 1
         assert result["articles_stored"] >= 1
 
-        articles = news_repo.get_news_articles(cid)
+        articles = news_repo.get_news_articles(alpha_id)
         assert len(articles) >= 1
         assert articles[0]["title"] == "Alpha Inc raises Series A funding"
 
@@ -1807,18 +2090,17 @@ class TestNewsMonitorManager:
 
         assert result["articles_stored"] == 0
 
-    def test_calculates_date_range_from_snapshots(self, db: Database) -> None:
+    def test_calculates_date_range_from_snapshots(self, db: Database, alpha_id: int) -> None:
         """Date range derived from snapshot dates when available."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# Old",
             captured_at="2024-06-01T00:00:00+00:00",
         )
         _insert_snapshot(
             db,
-            cid,
+            alpha_id,
             "# New",
             captured_at="2025-01-01T00:00:00+00:00",
         )
@@ -1831,16 +2113,14 @@ class TestNewsMonitorManager:
         snapshot_repo = SnapshotRepository(db, "test-user")
         manager = NewsMonitorManager(mock_kagi, news_repo, company_repo, snapshot_repo)
 
-        manager.search_company_news(company_id=cid)
+        manager.search_company_news(company_id=alpha_id)
 
         call_args = mock_kagi.search.call_args
         after_date = call_args.kwargs.get("after_date", call_args[1].get("after_date", ""))
         assert after_date == "2024-06-01"
 
-    def test_fallback_date_range_without_snapshots(self, db: Database) -> None:
+    def test_fallback_date_range_without_snapshots(self, db: Database, alpha_id: int) -> None:
         """Without snapshots, date range defaults to 90 days."""
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
-
         mock_kagi = MagicMock()
         mock_kagi.search.return_value = []
 
@@ -1849,7 +2129,7 @@ class TestNewsMonitorManager:
         snapshot_repo = SnapshotRepository(db, "test-user")
         manager = NewsMonitorManager(mock_kagi, news_repo, company_repo, snapshot_repo)
 
-        manager.search_company_news(company_id=cid)
+        manager.search_company_news(company_id=alpha_id)
 
         call_args = mock_kagi.search.call_args
         after_date = call_args.kwargs.get("after_date") or call_args[1].get("after_date")
@@ -1980,30 +2260,13 @@ class TestNewsAnalyzer:
 class TestBrandingLogoProcessor:
     """Contract tests for BrandingLogoProcessor with mocked HTTP downloads."""
 
-    def test_process_branding_logo_stores_logo(self, db: Database) -> None:
+    def test_process_branding_logo_stores_logo(self, db: Database, alpha_id: int) -> None:
         """Happy path: branding logo is downloaded and stored."""
-        from io import BytesIO
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from PIL import Image
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         processor = BrandingLogoProcessor(logo_repo)
 
-        # Create a valid small PNG image
-        img = Image.new("RGB", (64, 64), color="red")
-        buf = BytesIO()
-        img.save(buf, format="PNG")
-        png_bytes = buf.getvalue()
-
         mock_response = MagicMock()
-        mock_response.content = png_bytes
+        mock_response.iter_content.return_value = [_PNG_64]
         mock_response.headers = {"Content-Type": "image/png"}
         mock_response.raise_for_status = MagicMock()
 
@@ -2012,54 +2275,177 @@ class TestBrandingLogoProcessor:
             images=None,
         )
 
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        with patch.object(
+            processor.session,
+            "get",
             return_value=mock_response,
         ):
-            result = processor.process_branding_logo(cid, branding)
+            result = processor.process_branding_logo(alpha_id, branding)
 
         assert result is True
-        stored = logo_repo.get_company_logo(cid)
+        stored = logo_repo.get_company_logo(alpha_id)
         assert stored is not None
         assert stored["source_url"] == "https://alpha.com/logo.png"
         assert stored["extraction_location"] == "branding"
         assert stored["perceptual_hash"] != ""
         assert stored["image_format"] == "PNG"
 
+    def test_identical_logo_bytes_decoded_once(self, db: Database, alpha_id: int) -> None:
+        """A logo already processed in this run is reused without re-decoding."""
+        beta_id = _insert_company(db, "Beta Inc", "https://beta.com")
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
+
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [_PNG_64]
+        mock_response.headers = {"Content-Type": "image/png"}
+        mock_response.raise_for_status = MagicMock()
+
+        module = "src.domains.discovery.services.branding_logo_processor"
+        with (
+            patch.object(processor.session, "get", return_value=mock_response),
+            patch(f"{module}.image_from_bytes", wraps=image_from_bytes) as mock_decode,
+        ):
+            for cid, domain in ((alpha_id, "alpha.com"), (beta_id, "beta.com")):
+                branding = SimpleNamespace(logo=f"https://{domain}/favicon.png", images=None)
+                assert processor.process_branding_logo(cid, branding) is True
+
+        assert mock_decode.call_count == 1
+        alpha_logo = logo_repo.get_company_logo(alpha_id)
+        beta_logo = logo_repo.get_company_logo(beta_id)
+        assert alpha_logo is not None
+        assert beta_logo is not None
+        assert alpha_logo["perceptual_hash"] == beta_logo["perceptual_hash"]
+        assert beta_logo["source_url"] == "https://beta.com/favicon.png"
+
+    def test_bulk_processing_stores_each_company_logo(self, db: Database, alpha_id: int) -> None:
+        """Bulk processing downloads every logo and skips entries without a URL."""
+        beta_id = _insert_company(db, "Beta Inc", "https://beta.com")
+        gamma_id = _insert_company(db, "Gamma Inc", "https://gamma.com")
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
+
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [_PNG_64]
+        mock_response.headers = {"Content-Type": "image/png"}
+
+        items = [
+            (alpha_id, SimpleNamespace(logo="https://alpha.com/logo.png", images=None)),
+            (beta_id, SimpleNamespace(logo="https://beta.com/logo.png", images=None)),
+            (gamma_id, SimpleNamespace(logo=None, images=None)),
+        ]
+        with patch.object(processor.session, "get", return_value=mock_response) as mock_get:
+            stored = processor.process_branding_logos_bulk(items, max_workers=4)
+
+        assert stored == 2
+        assert mock_get.call_count == 2
+        beta_logo = logo_repo.get_company_logo(beta_id)
+        assert beta_logo is not None
+        assert beta_logo["source_url"] == "https://beta.com/logo.png"
+        assert logo_repo.get_company_logo(gamma_id) is None
+
+    def test_bulk_processing_drops_only_logo_that_fails_to_encode(
+        self, db: Database, alpha_id: int
+    ) -> None:
+        """An encode failure drops that logo without failing the rest of the batch."""
+        beta_id = _insert_company(db, "Beta Inc", "https://beta.com")
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
+
+        bodies = {
+            "https://alpha.com/logo.png": _PNG_64,
+            "https://beta.com/logo.png": _make_png((48, 48), color="blue"),
+        }
+
+        def fake_get(url: str, **kwargs: Any) -> MagicMock:
+            response = MagicMock()
+            response.headers = {"Content-Type": "image/png"}
+            response.iter_content.return_value = [bodies[url]]
+            return response
+
+        def failing_encode(image: Image.Image, format: str = "PNG") -> str:
+            if image.size == (48, 48):
+                raise OSError("encoder error")
+            return encode_image_to_base64(image, format=format)
+
+        items = [
+            (alpha_id, SimpleNamespace(logo="https://alpha.com/logo.png", images=None)),
+            (beta_id, SimpleNamespace(logo="https://beta.com/logo.png", images=None)),
+        ]
+        module = "src.domains.discovery.services.branding_logo_processor"
+        with (
+            patch.object(processor.session, "get", side_effect=fake_get),
+            patch(f"{module}.encode_image_to_base64", side_effect=failing_encode),
+        ):
+            stored = processor.process_branding_logos_bulk(items)
+
+        assert stored == 1
+        assert logo_repo.get_company_logo(alpha_id) is not None
+        assert logo_repo.get_company_logo(beta_id) is None
+
+    def test_bulk_processing_drops_only_logo_that_fails_to_hash(
+        self, db: Database, alpha_id: int
+    ) -> None:
+        """When batch hashing fails, images are hashed singly and only failures dropped."""
+        beta_id = _insert_company(db, "Beta Inc", "https://beta.com")
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
+
+        bodies = {
+            "https://alpha.com/logo.png": _PNG_64,
+            "https://beta.com/logo.png": _make_png((48, 48), color="blue"),
+        }
+
+        def fake_get(url: str, **kwargs: Any) -> MagicMock:
+            response = MagicMock()
+            response.headers = {"Content-Type": "image/png"}
+            response.iter_content.return_value = [bodies[url]]
+            return response
+
+        def failing_hash(image: Image.Image) -> str:
+            if image.size == (48, 48):
+                raise ValueError("bad image")
+            return compute_perceptual_hash(image)
+
+        items = [
+            (alpha_id, SimpleNamespace(logo="https://alpha.com/logo.png", images=None)),
+            (beta_id, SimpleNamespace(logo="https://beta.com/logo.png", images=None)),
+        ]
+        module = "src.domains.discovery.services.branding_logo_processor"
+        with (
+            patch.object(processor.session, "get", side_effect=fake_get),
+            patch(f"{module}.compute_perceptual_hashes", side_effect=ValueError("bad image")),
+            patch(f"{module}.compute_perceptual_hash", side_effect=failing_hash),
+        ):
+            stored = processor.process_branding_logos_bulk(items)
+
+        assert stored == 1
+        alpha_logo = logo_repo.get_company_logo(alpha_id)
+        assert alpha_logo is not None
+        assert alpha_logo["perceptual_hash"] == compute_perceptual_hash(image_from_bytes(_PNG_64))
+        assert logo_repo.get_company_logo(beta_id) is None
+
     def test_process_branding_logo_returns_false_when_no_url(
         self,
         db: Database,
+        alpha_id: int,
     ) -> None:
         """Returns False when branding data has no valid logo URL."""
-        from types import SimpleNamespace
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         processor = BrandingLogoProcessor(logo_repo)
 
         branding = SimpleNamespace(logo=None, images=None)
-        result = processor.process_branding_logo(cid, branding)
+        result = processor.process_branding_logo(alpha_id, branding)
 
         assert result is False
-        assert logo_repo.get_company_logo(cid) is None
+        assert logo_repo.get_company_logo(alpha_id) is None
 
     def test_process_branding_logo_handles_download_failure(
         self,
         db: Database,
+        alpha_id: int,
     ) -> None:
         """Returns False on download failure without crashing."""
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         processor = BrandingLogoProcessor(logo_repo)
 
@@ -2068,33 +2454,27 @@ class TestBrandingLogoProcessor:
             images=None,
         )
 
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        with patch.object(
+            processor.session,
+            "get",
             side_effect=ConnectionError("timeout"),
         ):
-            result = processor.process_branding_logo(cid, branding)
+            result = processor.process_branding_logo(alpha_id, branding)
 
         assert result is False
-        assert logo_repo.get_company_logo(cid) is None
+        assert logo_repo.get_company_logo(alpha_id) is None
 
     def test_process_branding_logo_handles_non_image_response(
         self,
         db: Database,
+        alpha_id: int,
     ) -> None:
         """Returns False when response is not an image."""
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         processor = BrandingLogoProcessor(logo_repo)
 
         mock_response = MagicMock()
-        mock_response.content = b"<html>Not an image</html>"
+        mock_response.iter_content.return_value = [b"<html>Not an image</html>"]
         mock_response.headers = {"Content-Type": "text/html"}
         mock_response.raise_for_status = MagicMock()
 
@@ -2103,28 +2483,107 @@ class TestBrandingLogoProcessor:
             images=None,
         )
 
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        with patch.object(
+            processor.session,
+            "get",
             return_value=mock_response,
         ):
-            result = processor.process_branding_logo(cid, branding)
+            result = processor.process_branding_logo(alpha_id, branding)
 
         assert result is False
 
-    def test_company_has_logo_true_when_exists(self, db: Database) -> None:
-        """company_has_logo returns True when logo exists in DB."""
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
+    def test_process_branding_logo_rejects_oversized_download(
+        self,
+        db: Database,
+        alpha_id: int,
+    ) -> None:
+        """Oversized downloads are rejected from the headers, and closed unread."""
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
 
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
+        mock_response = MagicMock()
+        mock_response.headers = {
+            "Content-Type": "image/png",
+            "Content-Length": str(50 * 1024 * 1024),
+        }
+
+        branding = SimpleNamespace(logo="https://alpha.com/logo.png", images=None)
+        with patch.object(processor.session, "get", return_value=mock_response):
+            result = processor.process_branding_logo(alpha_id, branding)
+
+        assert result is False
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
+        assert logo_repo.get_company_logo(alpha_id) is None
+
+    def test_process_branding_logo_stops_reading_oversized_stream(
+        self,
+        db: Database,
+        alpha_id: int,
+    ) -> None:
+        """A body without Content-Length is abandoned once it passes the size cap."""
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
+
+        chunk = b"\x89PNG\r\n\x1a\n" + b"\x00" * (1024 * 1024 - 8)
+        chunks_read = 0
+
+        def endless_body(chunk_size: int) -> Iterator[bytes]:
+            nonlocal chunks_read
+            while True:
+                chunks_read += 1
+                yield chunk
+
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "image/png"}
+        mock_response.iter_content.side_effect = endless_body
+
+        branding = SimpleNamespace(logo="https://alpha.com/logo.png", images=None)
+        with patch.object(processor.session, "get", return_value=mock_response):
+            result = processor.process_branding_logo(alpha_id, branding)
+
+        assert result is False
+        assert chunks_read == 6
+        mock_response.close.assert_called_once()
+        assert logo_repo.get_company_logo(alpha_id) is None
+
+    def test_process_branding_logo_rejects_html_served_as_image(
+        self,
+        db: Database,
+        alpha_id: int,
+    ) -> None:
+        """Bodies without a raster signature are rejected before decoding."""
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        processor = BrandingLogoProcessor(logo_repo)
+
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "image/png"}
+        mock_response.iter_content.return_value = [
+            b"<!DOCTYPE html><html><body>Not found</body></html>"
+        ]
+
+        branding = SimpleNamespace(logo="https://alpha.com/logo.png", images=None)
+        with (
+            patch.object(processor.session, "get", return_value=mock_response),
+            patch(
+                "src.domains.discovery.services.branding_logo_processor.image_from_bytes"
+            ) as mock_decode,
+        ):
+            result = processor.process_branding_logo(alpha_id, branding)
+
+        assert result is False
+        mock_decode.assert_not_called()
+        assert logo_repo.get_company_logo(alpha_id) is None
+
+    def test_company_has_logo_true_when_exists(self, db: Database, alpha_id: int) -> None:
+        """company_has_logo returns True when logo exists in DB."""
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         processor = BrandingLogoProcessor(logo_repo)
 
         # Insert a logo directly
         logo_repo.store_company_logo(
             {
-                "company_id": cid,
+                "company_id": alpha_id,
                 "image_data": b"fake-data",
                 "image_format": "PNG",
                 "perceptual_hash": "abcdef1234567890",
@@ -2136,19 +2595,14 @@ class TestBrandingLogoProcessor:
             }
         )
 
-        assert processor.company_has_logo(cid) is True
+        assert processor.company_has_logo(alpha_id) is True
 
-    def test_company_has_logo_false_when_missing(self, db: Database) -> None:
+    def test_company_has_logo_false_when_missing(self, db: Database, alpha_id: int) -> None:
         """company_has_logo returns False when no logo exists."""
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         processor = BrandingLogoProcessor(logo_repo)
 
-        assert processor.company_has_logo(cid) is False
+        assert processor.company_has_logo(alpha_id) is False
 
 
 # ===========================================================================
@@ -2162,30 +2616,14 @@ class TestSnapshotManagerBrandingIntegration:
     def test_stores_branding_logo_when_company_has_no_logo(
         self,
         db: Database,
+        alpha_id: int,
     ) -> None:
         """Branding logo is stored for company without existing logo."""
-        from io import BytesIO
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from PIL import Image
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         logo_processor = BrandingLogoProcessor(logo_repo)
 
-        # Create valid PNG for download mock
-        img = Image.new("RGB", (64, 64), color="blue")
-        buf = BytesIO()
-        img.save(buf, format="PNG")
-        png_bytes = buf.getvalue()
-
         mock_download = MagicMock()
-        mock_download.content = png_bytes
+        mock_download.iter_content.return_value = [_PNG_64_BLUE]
         mock_download.headers = {"Content-Type": "image/png"}
         mock_download.raise_for_status = MagicMock()
 
@@ -2216,35 +2654,28 @@ class TestSnapshotManagerBrandingIntegration:
             logo_processor=logo_processor,
         )
 
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        with patch.object(
+            logo_processor.session,
+            "get",
             return_value=mock_download,
         ):
             summary = manager.capture_all_snapshots()
 
         assert summary["successful"] == 1
-        stored_logo = logo_repo.get_company_logo(cid)
+        stored_logo = logo_repo.get_company_logo(alpha_id)
         assert stored_logo is not None
         assert stored_logo["source_url"] == "https://alpha.com/brand-logo.png"
         assert stored_logo["extraction_location"] == "branding"
 
-    def test_skips_logo_when_company_already_has_one(self, db: Database) -> None:
+    def test_skips_logo_when_company_already_has_one(self, db: Database, alpha_id: int) -> None:
         """Branding logo is NOT downloaded when company already has a logo."""
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         logo_processor = BrandingLogoProcessor(logo_repo)
 
         # Pre-insert a logo
         logo_repo.store_company_logo(
             {
-                "company_id": cid,
+                "company_id": alpha_id,
                 "image_data": b"existing-logo",
                 "image_format": "PNG",
                 "perceptual_hash": "existinghash1234",
@@ -2283,9 +2714,10 @@ class TestSnapshotManagerBrandingIntegration:
             logo_processor=logo_processor,
         )
 
-        # requests.get should NOT be called since company has logo
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        # The logo download should NOT happen since company has logo
+        with patch.object(
+            logo_processor.session,
+            "get",
         ) as mock_get:
             summary = manager.capture_all_snapshots()
 
@@ -2293,14 +2725,46 @@ class TestSnapshotManagerBrandingIntegration:
         mock_get.assert_not_called()
 
         # Verify the old logo is still there, not overwritten
-        stored = logo_repo.get_company_logo(cid)
+        stored = logo_repo.get_company_logo(alpha_id)
         assert stored is not None
         assert stored["source_url"] == "https://alpha.com/old-logo.png"
 
-    def test_works_without_logo_processor(self, db: Database) -> None:
-        """Backward compatible: no logo_processor means no logo processing."""
-        _insert_company(db, "Alpha Inc", "https://alpha.com")
+    def test_checks_existing_logos_once_per_run(self, db: Database, alpha_id: int) -> None:
+        """Existing logos are looked up in one query, not once per company."""
+        _insert_company(db, "Beta", "https://beta.com")
+        logo_repo = SocialMediaLinkRepository(db, "test-user")
+        logo_processor = BrandingLogoProcessor(logo_repo)
+
+        mock_firecrawl = MagicMock()
+        mock_firecrawl.capture_snapshot.return_value = {
+            "success": True,
+            "markdown": "# Page",
+            "html": "<h1>Page</h1>",
+            "statusCode": 200,
+            "metadata": {},
+            "has_paywall": False,
+            "has_auth_required": False,
+            "error": None,
+            "branding": None,
+        }
+
+        manager = SnapshotManager(
+            mock_firecrawl,
+            SnapshotRepository(db, "test-user"),
+            CompanyRepository(db, "test-user"),
+            logo_processor=logo_processor,
+        )
 
+        with patch.object(
+            logo_repo, "get_company_ids_with_logos", wraps=logo_repo.get_company_ids_with_logos
+        ) as mock_lookup:
+            summary = manager.capture_all_snapshots()
+
+        assert summary["successful"] == 2
+        assert mock_lookup.call_count == 1
+
+    def test_works_without_logo_processor(self, db: Database, alpha_id: int) -> None:
+        """Backward compatible: no logo_processor means no logo processing."""
         mock_firecrawl = MagicMock()
         mock_firecrawl.capture_snapshot.return_value = {
             "success": True,
@@ -2331,30 +2795,13 @@ class TestSnapshotManagerBrandingIntegration:
 class TestBatchSnapshotManagerBrandingIntegration:
     """Tests for BatchSnapshotManager branding logo processing."""
 
-    def test_batch_processes_branding_logos(self, db: Database) -> None:
+    def test_batch_processes_branding_logos(self, db: Database, alpha_id: int) -> None:
         """Branding logos are stored during batch capture."""
-        from io import BytesIO
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from PIL import Image
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         logo_processor = BrandingLogoProcessor(logo_repo)
 
-        # Create valid PNG
-        img = Image.new("RGB", (64, 64), color="green")
-        buf = BytesIO()
-        img.save(buf, format="PNG")
-        png_bytes = buf.getvalue()
-
         mock_download = MagicMock()
-        mock_download.content = png_bytes
+        mock_download.iter_content.return_value = [_PNG_64_GREEN]
         mock_download.headers = {"Content-Type": "image/png"}
         mock_download.raise_for_status = MagicMock()
 
@@ -2390,34 +2837,27 @@ class TestBatchSnapshotManagerBrandingIntegration:
             logo_processor=logo_processor,
         )
 
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        with patch.object(
+            logo_processor.session,
+            "get",
             return_value=mock_download,
         ):
             summary = manager.capture_batch_snapshots(batch_size=10)
 
         assert summary["successful"] == 1
-        stored = logo_repo.get_company_logo(cid)
+        stored = logo_repo.get_company_logo(alpha_id)
         assert stored is not None
         assert stored["extraction_location"] == "branding"
 
-    def test_batch_skips_logos_when_already_exist(self, db: Database) -> None:
+    def test_batch_skips_logos_when_already_exist(self, db: Database, alpha_id: int) -> None:
         """Batch mode skips logo download for companies with existing logos."""
-        from types import SimpleNamespace
-        from unittest.mock import patch
-
-        from src.domains.discovery.services.branding_logo_processor import (
-            BrandingLogoProcessor,
-        )
-
-        cid = _insert_company(db, "Alpha Inc", "https://alpha.com")
         logo_repo = SocialMediaLinkRepository(db, "test-user")
         logo_processor = BrandingLogoProcessor(logo_repo)
 
         # Pre-insert a logo
         logo_repo.store_company_logo(
             {
-                "company_id": cid,
+                "company_id": alpha_id,
                 "image_data": b"existing",
                 "image_format": "PNG",
                 "perceptual_hash": "existinghash5678",
@@ -2461,14 +2901,15 @@ class TestBatchSnapshotManagerBrandingIntegration:
             logo_processor=logo_processor,
         )
 
-        with patch(
-            "src.domains.discovery.services.branding_logo_processor.requests.get",
+        with patch.object(
+            logo_processor.session,
+            "get",
         ) as mock_get:
             summary = manager.capture_batch_snapshots(batch_size=10)
 
         assert summary["successful"] == 1
         mock_get.assert_not_called()
 
-        stored = logo_repo.get_company_logo(cid)
+        stored = logo_repo.get_company_logo(alpha_id)
         assert stored is not None
         assert stored["source_url"] == "https://alpha.com/old.png"
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import hashlib
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
@@ -28,14 +28,14 @@ from src.domains.monitoring.repositories.snapshot_repository import (
     SnapshotRepository,
 )
 from src.repositories.company_repository import CompanyRepository
-from src.services.database import Database
+
+if TYPE_CHECKING:
+    from src.services.database import Database
 
 
 @pytest.fixture
-def tmp_db(tmp_path: Any) -> Database:
-    """Create a temp database with full schema."""
-    db = Database(db_path=str(tmp_path / "test.db"))
-    db.init_db()
+def tmp_db(db: Database) -> Database:
+    """Temp database with full schema, cloned from the session template."""
     return db
 
 
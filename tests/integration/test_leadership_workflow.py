@@ -6,7 +6,7 @@ Full end-to-end tests with real temp database, mocked external APIs.
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
@@ -20,14 +20,14 @@ from src.domains.leadership.repositories.leadership_repository import (
 from src.domains.leadership.services.cdp_browser import CDPBlockedError
 from src.domains.leadership.services.leadership_manager import LeadershipManager
 from src.repositories.company_repository import CompanyRepository
-from src.services.database import Database
+
+if TYPE_CHECKING:
+    from src.services.database import Database
 
 
 @pytest.fixture
-def tmp_db(tmp_path: Any) -> Database:
-    """Create a temp database with full schema."""
-    db = Database(db_path=str(tmp_path / "test.db"))
-    db.init_db()
+def tmp_db(db: Database) -> Database:
+    """Temp database with full schema, cloned from the session template."""
     return db
 
 
@@ -234,16 +234,13 @@ class TestLeadershipExtractionWorkflow:
         now = datetime.now(UTC).isoformat()
 
         # Create 3 companies
-        company_ids = []
-        for i in range(3):
-            cursor = tmp_db.execute(
-                """INSERT INTO companies
-                   (name, homepage_url, source_sheet, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (f"BatchCo{i}", f"https://batch{i}.com", "Sheet1", now, now),
-            )
-            tmp_db.connection.commit()
-            company_ids.append(cursor.lastrowid)
+        tmp_db.executemany(
+            """INSERT INTO companies
+               (name, homepage_url, source_sheet, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            [(f"BatchCo{i}", f"https://batch{i}.com", "Sheet1", now, now) for i in range(3)],
+        )
+        tmp_db.connection.commit()
 
         manager = _build_manager(
             tmp_db,
@@ -260,6 +257,34 @@ class TestLeadershipExtractionWorkflow:
         assert result["processed"] == 3
         assert result["successful"] == 3
 
+    def test_parallel_extraction_stores_on_calling_thread(
+        self, tmp_db: Database, company_with_linkedin: int
+    ) -> None:
+        """Parallel mode searches Kagi in workers and stores results on the DB thread."""
+        manager = _build_manager(
+            tmp_db,
+            kagi_results=[
+                {
+                    "name": "Parallel Leader",
+                    "title": "CEO",
+                    "profile_url": "https://linkedin.com/in/parallel-leader",
+                },
+            ],
+        )
+
+        result = manager.extract_all_leadership(max_workers=4)
+
+        assert result["successful"] == 1
+        assert result["total_leaders_found"] == 1
+        manager.browser.extract_people.assert_not_called()
+        leaders = LeadershipRepository(tmp_db, "test-user").get_current_leadership(
+            company_with_linkedin
+        )
+        assert [leader["person_name"] for leader in leaders] == ["Parallel Leader"]
+        assert leaders[0]["source_company_linkedin_url"] == (
+            "https://www.linkedin.com/company/integrationco"
+        )
+
     def test_significance_classification_on_critical_change(
         self, tmp_db: Database, company_with_linkedin: int
     ) -> None:
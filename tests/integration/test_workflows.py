@@ -45,8 +45,6 @@ from src.services.extractor import CompanyExtractor
 from src.services.snapshot_manager import SnapshotManager
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from src.services.database import Database
 
 
@@ -56,14 +54,13 @@ if TYPE_CHECKING:
 
 
 @pytest.fixture
-def workflow_db(tmp_path: Path) -> Database:
-    """Fresh initialized database for integration tests."""
-    from src.services.database import Database as DatabaseImpl
-
-    db_path = str(tmp_path / "integration_test.db")
-    database = DatabaseImpl(db_path=db_path)
-    database.init_db()
-    return database
+def workflow_db(db: Database) -> Database:
+    """Fresh initialized database for integration tests.
+
+    Cloned from the session-wide schema template by the shared ``db``
+    fixture rather than re-running init_db() for every test.
+    """
+    return db
 
 
 def _insert_company(db: Database, name: str, homepage_url: str | None) -> int:
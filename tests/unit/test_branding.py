@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from src.core.branding import extract_branding_logo_url
+from src.core.branding import Branding, extract_branding_logo_url, to_branding
 
 
 class TestExtractBrandingLogoUrl:
@@ -161,3 +161,32 @@ class TestExtractBrandingLogoUrl:
         """Empty images dict returns None."""
         branding = SimpleNamespace(logo=None, images={})
         assert extract_branding_logo_url(branding) is None
+
+
+class TestToBranding:
+    """Tests for reducing a BrandingProfile to the logo-related fields."""
+
+    def test_keeps_logo_and_images_only(self) -> None:
+        """Unrelated profile fields are dropped."""
+        profile = SimpleNamespace(
+            logo="https://acme.com/logo.png",
+            images={"favicon": "https://acme.com/favicon.ico"},
+            fonts=[{"family": "Inter"}],
+            colors={"primary": "#000"},
+        )
+        branding = to_branding(profile)
+        assert branding == Branding(
+            logo="https://acme.com/logo.png",
+            images={"favicon": "https://acme.com/favicon.ico"},
+        )
+        assert extract_branding_logo_url(branding) == "https://acme.com/logo.png"
+
+    def test_dict_profile(self) -> None:
+        """Dict profiles are reduced the same way."""
+        branding = to_branding({"images": {"og_image": "https://acme.com/og.png"}})
+        assert branding == Branding(logo=None, images={"og_image": "https://acme.com/og.png"})
+
+    def test_profile_without_logo_data_returns_none(self) -> None:
+        """Profiles with no logo or images collapse to None."""
+        assert to_branding(None) is None
+        assert to_branding(SimpleNamespace(logo=" ", images={}, fonts=[])) is None
@@ -141,6 +141,10 @@ class TestDetectPlatform:
     def test_case_insensitive(self) -> None:
         assert detect_platform("https://LINKEDIN.COM/company/acme") == Platform.LINKEDIN
 
+    def test_pattern_order_wins_over_match_position(self) -> None:
+        url = "https://x.com/share?u=https://linkedin.com/company/acme"
+        assert detect_platform(url) == Platform.LINKEDIN
+
     def test_youtube_bare_domain_no_match(self) -> None:
         """youtube.com without /c/, /channel/, @, or /user/ should NOT match."""
         assert detect_platform("https://youtube.com") is None
@@ -355,6 +359,10 @@ class TestExtractLinksFromMarkdown:
         result = extract_links_from_markdown(md)
         assert result.count("https://twitter.com/acme") == 1
 
+    def test_repeated_bare_urls_kept_once_in_first_seen_order(self) -> None:
+        md = "https://b.com/x then https://a.com/y then https://b.com/x again"
+        assert extract_links_from_markdown(md) == ["https://b.com/x", "https://a.com/y"]
+
     def test_empty_string(self) -> None:
         assert extract_links_from_markdown("") == []
 
@@ -433,6 +441,11 @@ class TestExtractLinksFromHtml:
         result = extract_links_from_html(html)
         assert result == ["https://twitter.com/acme"]
 
+    def test_uppercase_and_unclosed_tags(self) -> None:
+        html = '<DIV><A HREF="https://twitter.com/acme">T<p><a href="https://github.com/acme">G'
+        result = extract_links_from_html(html)
+        assert result == ["https://twitter.com/acme", "https://github.com/acme"]
+
 
 class TestExtractSchemaOrgLinks:
     """Tests for extract_schema_org_links()."""
@@ -919,6 +932,10 @@ class TestDetectBlogUrl:
         assert is_blog is True
         assert blog_type == BlogType.MEDIUM
 
+    def test_blog_path_with_params_and_mixed_case(self) -> None:
+        assert detect_blog_url("https://ACME.com/News;v=1") == (True, BlogType.COMPANY_BLOG)
+        assert detect_blog_url("https://acme.com/;blog") == (False, None)
+
     def test_substack(self) -> None:
         is_blog, blog_type = detect_blog_url("https://acme.substack.com/p/article")
         assert is_blog is True
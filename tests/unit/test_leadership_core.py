@@ -105,6 +105,10 @@ class TestExtractLeadershipTitle:
         result = extract_leadership_title(text)
         assert result is not None
 
+    def test_longest_title_wins_over_earlier_shorter_one(self) -> None:
+        result = extract_leadership_title("CEO and Chief Technology Officer at Acme")
+        assert result == "Chief Technology Officer"
+
     def test_empty_string(self) -> None:
         assert extract_leadership_title("") is None
 
@@ -530,6 +530,10 @@ class TestExtractCopyrightYear:
         content = "(c) 2020 Company. Copyright 2023 Other Corp."
         assert extract_copyright_year(content) == 2023
 
+    def test_highest_year_wins_regardless_of_marker_order(self) -> None:
+        content = "\u00a9 2024 Brand. (C) 2019 Old. copyright 2015-2021 Legacy. (c)2022"
+        assert extract_copyright_year(content) == 2024
+
     def test_no_copyright_marker(self) -> None:
         """A bare year without a copyright marker should NOT be extracted."""
         assert extract_copyright_year("Founded in 2024") is None
@@ -614,6 +618,20 @@ class TestDetectAcquisition:
         detected, _ = detect_acquisition("Acme Corp Was ACQUIRED BY BigCo.")
         assert detected is True
 
+    def test_sold_to_commerce_context_skipped_before_real_match(self) -> None:
+        content = (
+            "Goods sold to\n  customers daily. Produce sold to retail. Acme was sold to BigCo."
+        )
+        detected, context = detect_acquisition(content)
+        assert detected is True
+        assert context is not None
+        assert "BigCo" in context
+
+    def test_sold_to_commerce_context_only(self) -> None:
+        detected, context = detect_acquisition("Goods sold to   the public and sold to users.")
+        assert detected is False
+        assert context is None
+
     def test_is_now_available_not_matched(self) -> None:
         """'is now available' should NOT trigger acquisition detection.
         The function requires specific corporate structure words after 'is now'."""
@@ -13,13 +13,16 @@ from PIL import Image
 from src.utils.image_utils import (
     compute_hash_similarity,
     compute_perceptual_hash,
+    compute_perceptual_hashes,
     decode_base64_image,
     encode_image_to_base64,
     get_image_dimensions,
     get_image_format,
+    hamming_distance,
     image_from_bytes,
     is_valid_logo_size,
     resize_image,
+    sniff_image_format,
 )
 from src.utils.progress import ProgressTracker
 from src.utils.validators import (
@@ -339,6 +342,23 @@ class TestComputePerceptualHash:
         assert isinstance(hash_blue, str)
 
 
+class TestComputePerceptualHashes:
+    """Tests for compute_perceptual_hashes (batched pHash)."""
+
+    def test_empty_input(self) -> None:
+        assert compute_perceptual_hashes([]) == []
+
+    def test_matches_single_image_hash(self) -> None:
+        gradient = Image.linear_gradient("L").resize((120, 80))
+        images = [
+            gradient,
+            gradient.rotate(90, expand=True).convert("RGB"),
+            _make_test_image(64, 64, "red"),
+            Image.new("RGBA", (40, 64), color="blue"),
+        ]
+        assert compute_perceptual_hashes(images) == [compute_perceptual_hash(img) for img in images]
+
+
 class TestComputeHashSimilarity:
     """Tests for compute_hash_similarity."""
 
@@ -357,6 +377,42 @@ class TestComputeHashSimilarity:
         assert 0.0 <= sim <= 1.0
 
 
+class TestSniffImageFormat:
+    """Tests for sniff_image_format."""
+
+    @pytest.mark.parametrize("fmt", ["PNG", "JPEG", "GIF", "ICO", "BMP", "WEBP"])
+    def test_recognizes_raster_formats(self, fmt: str) -> None:
+        buf = io.BytesIO()
+        _make_test_image(32, 32, "red").save(buf, format=fmt)
+        assert sniff_image_format(buf.getvalue()) == fmt
+
+    @pytest.mark.parametrize("fmt", ["PPM", "QOI", "TGA"])
+    def test_falls_back_to_pillow_for_unlisted_formats(self, fmt: str) -> None:
+        buf = io.BytesIO()
+        _make_test_image(32, 32, "red").save(buf, format=fmt)
+        assert sniff_image_format(buf.getvalue()) == fmt
+
+    def test_rejects_html_and_svg(self) -> None:
+        assert sniff_image_format(b"<!DOCTYPE html><html></html>") is None
+        assert sniff_image_format(b'<svg xmlns="http://www.w3.org/2000/svg"/>') is None
+        assert sniff_image_format(b"") is None
+
+
+class TestHammingDistance:
+    """Tests for hamming_distance."""
+
+    def test_counts_differing_bits(self) -> None:
+        assert hamming_distance("ffffffffffff0000", "ffffffffffff00ff") == 8
+        assert hamming_distance("0000000000000000", "ffffffffffffffff") == 64
+
+    def test_identical_hashes(self) -> None:
+        assert hamming_distance("abcdef0123456789", "abcdef0123456789") == 0
+
+    def test_length_mismatch_raises(self) -> None:
+        with pytest.raises(TypeError):
+            hamming_distance("ff", "ffff")
+
+
 class TestResizeImage:
     """Tests for resize_image."""
 